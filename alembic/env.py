@@ -13,7 +13,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from app.core.config import settings
-from app.core.database import Base
+from app.core.db_base import Base
 
 # Import all models to ensure they're registered with Base.metadata
 from app.models import (
@@ -0,0 +1,44 @@
+"""uuid_server_default
+
+Revision ID: c6c51cf5221a
+Revises: ed0d521e91b8
+Create Date: 2025-10-31 09:15:12.418903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6c51cf5221a'
+down_revision = 'ed0d521e91b8'
+branch_labels = None
+depends_on = None
+
+
+# Tables whose primary key comes from BaseModel.id
+TABLES = ("projects", "project_files", "proposals", "timeline_events")
+
+
+def upgrade() -> None:
+    """
+    Generate primary key UUIDs in PostgreSQL instead of Python.
+    
+    gen_random_uuid() is built into PostgreSQL 13+; pgcrypto provides it
+    on older servers. With a server default the ORM no longer builds a
+    uuid4 per row and reads the generated id back via INSERT ... RETURNING.
+    
+    users.id is left alone: fastapi-users assigns it client-side.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    """
+    Remove server-side UUID defaults (ids generated by the application again).
+    """
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
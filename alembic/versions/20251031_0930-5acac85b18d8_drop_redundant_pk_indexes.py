@@ -0,0 +1,40 @@
+"""drop_redundant_pk_indexes
+
+Revision ID: 5acac85b18d8
+Revises: c6c51cf5221a
+Create Date: 2025-10-31 09:30:47.205316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5acac85b18d8'
+down_revision = 'c6c51cf5221a'
+branch_labels = None
+depends_on = None
+
+
+# Tables whose BaseModel.id got an extra unique index besides the PK
+TABLES = ("projects", "project_files", "proposals", "timeline_events")
+
+
+def upgrade() -> None:
+    """
+    Drop the unique ix_<table>_id indexes duplicating the primary key.
+    
+    The primary key constraint already creates a unique B-tree on id;
+    the extra index (from unique=True, index=True on BaseModel.id) only
+    doubled index maintenance on every INSERT and DELETE.
+    """
+    for table in TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_id")
+
+
+def downgrade() -> None:
+    """
+    Recreate the unique id indexes.
+    """
+    for table in TABLES:
+        op.create_index(f"ix_{table}_id", table, ["id"], unique=True)
@@ -0,0 +1,49 @@
+"""project_files_project_created_index
+
+Revision ID: ced2b7d4f06a
+Revises: 5acac85b18d8
+Create Date: 2025-10-31 09:45:03.771520
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ced2b7d4f06a'
+down_revision = '5acac85b18d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Replace the project_id index on project_files with (project_id, created_at DESC).
+    
+    File listings filter by project_id and order by created_at DESC; the
+    composite index returns rows already in order, so Postgres drops the
+    sort node and stops after LIMIT rows. The leading project_id column
+    still serves plain project_id lookups and the FK cascade, making the
+    single-column index redundant.
+    
+    Built CONCURRENTLY (outside the migration transaction) so uploads are
+    not blocked while the index builds.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_project_files_project_created
+            ON project_files (project_id, created_at DESC)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_project_files_project_id")
+
+
+def downgrade() -> None:
+    """
+    Restore the single-column project_id index.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_project_files_project_id
+            ON project_files (project_id)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_project_files_project_created")
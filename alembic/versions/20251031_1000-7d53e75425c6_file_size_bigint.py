@@ -0,0 +1,32 @@
+"""file_size_bigint
+
+Revision ID: 7d53e75425c6
+Revises: ced2b7d4f06a
+Create Date: 2025-10-31 10:00:26.934172
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d53e75425c6'
+down_revision = 'ced2b7d4f06a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Widen project_files.file_size from INTEGER to BIGINT.
+    
+    INTEGER caps at 2^31-1 bytes (~2 GB); larger uploads would overflow.
+    """
+    op.execute("ALTER TABLE project_files ALTER COLUMN file_size TYPE BIGINT")
+
+
+def downgrade() -> None:
+    """
+    Narrow file_size back to INTEGER (fails if any value exceeds 2 GB).
+    """
+    op.execute("ALTER TABLE project_files ALTER COLUMN file_size TYPE INTEGER")
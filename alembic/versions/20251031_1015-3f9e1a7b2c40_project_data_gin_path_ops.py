@@ -0,0 +1,50 @@
+"""project_data_gin_path_ops
+
+Revision ID: 3f9e1a7b2c40
+Revises: 7d53e75425c6
+Create Date: 2025-10-31 10:15:52.118604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9e1a7b2c40'
+down_revision = '7d53e75425c6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Rebuild ix_project_data_gin with the jsonb_path_ops operator class.
+    
+    jsonb_path_ops only indexes value paths, so it is roughly half the
+    size of the default jsonb_ops and faster for @> containment queries.
+    It does not support the key-existence operators (?, ?|, ?&), which
+    no query on projects.project_data uses.
+    
+    The new index is built CONCURRENTLY under a temporary name and then
+    swapped in, so projects stay writable and indexed throughout.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_project_data_gin_path_ops
+            ON projects USING gin (project_data jsonb_path_ops)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_project_data_gin")
+        op.execute("ALTER INDEX ix_project_data_gin_path_ops RENAME TO ix_project_data_gin")
+
+
+def downgrade() -> None:
+    """
+    Restore the default jsonb_ops GIN index.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_project_data_gin_jsonb_ops
+            ON projects USING gin (project_data)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_project_data_gin")
+        op.execute("ALTER INDEX ix_project_data_gin_jsonb_ops RENAME TO ix_project_data_gin")
@@ -0,0 +1,43 @@
+"""timeline_metadata_jsonb
+
+Revision ID: a4c8d2f61b93
+Revises: 3f9e1a7b2c40
+Create Date: 2025-10-31 10:30:14.502817
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4c8d2f61b93'
+down_revision = '3f9e1a7b2c40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Store timeline_events.event_metadata as JSONB instead of JSON.
+    
+    JSON is kept as text and reparsed by every operator applied to it;
+    JSONB is stored pre-parsed and matches projects.project_data and
+    proposals.ai_metadata. Key order and duplicate keys are not preserved,
+    which no reader relies on.
+    
+    The type change rewrites the table under an exclusive lock.
+    """
+    op.execute("""
+        ALTER TABLE timeline_events
+        ALTER COLUMN event_metadata TYPE JSONB USING event_metadata::jsonb
+    """)
+
+
+def downgrade() -> None:
+    """
+    Revert event_metadata to JSON.
+    """
+    op.execute("""
+        ALTER TABLE timeline_events
+        ALTER COLUMN event_metadata TYPE JSON USING event_metadata::json
+    """)
@@ -0,0 +1,49 @@
+"""timeline_events_project_created_index
+
+Revision ID: e91b5f3a7d28
+Revises: a4c8d2f61b93
+Create Date: 2025-10-31 10:45:37.219046
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e91b5f3a7d28'
+down_revision = 'a4c8d2f61b93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Replace the project_id index on timeline_events with (project_id, created_at DESC).
+    
+    The timeline endpoint and the Project.timeline relationship both read
+    a project's events newest first; the composite index returns them in
+    order, so Postgres skips the sort and stops after LIMIT rows. Its
+    leading project_id column still serves the FK cascade, making the
+    single-column index redundant.
+    
+    Built CONCURRENTLY (outside the migration transaction) so event
+    logging is not blocked while the index builds.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_timeline_events_project_created
+            ON timeline_events (project_id, created_at DESC)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_timeline_events_project_id")
+
+
+def downgrade() -> None:
+    """
+    Restore the single-column project_id index.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_timeline_events_project_id
+            ON timeline_events (project_id)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_timeline_events_project_created")
@@ -635,7 +635,7 @@ async def generate_enhanced_proposal(
 
         # 1. Extract and log clean AI context
         ai_context = water_data.to_ai_context()
-        ai_context_json = json.dumps(ai_context, indent=2, ensure_ascii=False)
+        ai_context_json = water_data.to_json_bytes(indent=True).decode()
 
         logger.info("🎯 CLEAN AI CONTEXT:")
         logger.info(f"\n{ai_context_json}")
@@ -654,7 +654,8 @@ async def generate_enhanced_proposal(
         logger.info("\n🏢 CLIENT METADATA:")
         logger.info(f"\n{metadata_json}")
 
-        # 4. Token efficiency info
+        # 4. Token efficiency info: full model JSON vs the formatted prompt text
+        # (not to_ai_context(), whose dict shape doesn't reach the prompt)
         full_json = water_data.model_dump_json(exclude_none=True)
         logger.info("\n💡 EFFICIENCY:")
         logger.info(f"  Full serialization: {len(full_json)} chars")
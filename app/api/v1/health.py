@@ -3,13 +3,13 @@ Health check endpoints for monitoring and load balancers.
 """
 
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from pydantic import BaseModel
 
-from app.core.database import async_engine
+from app.core.database import get_async_engine
 from app.services.cache_service import cache_service
 from app.core.config import settings
+from app.core.responses import AppJSONResponse
 
 import logging
 
@@ -59,7 +59,7 @@ async def health_check():
 
     # Check PostgreSQL
     try:
-        async with async_engine.connect() as conn:
+        async with get_async_engine().connect() as conn:
             await conn.execute(text("SELECT 1"))
         health_status["database"] = "healthy"
         logger.debug("✅ Database health check passed")
@@ -98,7 +98,7 @@ async def health_check():
     # Set overall status
     if not all_healthy:
         health_status["status"] = "degraded"
-        return JSONResponse(
+        return AppJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content=health_status
         )
@@ -134,12 +134,12 @@ async def readiness_probe():
     Verifies database connectivity.
     """
     try:
-        async with async_engine.connect() as conn:
+        async with get_async_engine().connect() as conn:
             await conn.execute(text("SELECT 1"))
         return {"status": "ready", "database": "connected"}
     except Exception as e:
         logger.error(f"❌ Readiness check failed: {e}")
-        return JSONResponse(
+        return AppJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "not ready", "database": f"error: {str(e)[:50]}"}
         )
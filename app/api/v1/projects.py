@@ -26,9 +26,8 @@ from app.schemas.project import (
 )
 from app.schemas.common import PaginatedResponse, ErrorResponse
 from app.models.project import Project
-from app.models.proposal import Proposal
 from sqlalchemy import select, func, case
-from sqlalchemy.orm import raiseload, selectinload, load_only
+from sqlalchemy.orm import raiseload, selectinload, load_only, undefer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -61,22 +60,13 @@ async def list_projects(
 
     Performance optimizations:
     - No relationship loading (raiseload) for list view
-    - Uses proposals_count property (no N+1)
+    - proposals_count from a SQL COUNT subquery (no proposals loaded)
     - Indexed queries for fast filtering
 
     Returns lightweight ProjectSummary objects.
     """
-    # Build query with selective loading
-    # ✅ Load only proposal IDs for count (proposals_count property needs it)
-    query = (
-        select(Project)
-        .where(Project.user_id == current_user.id)
-        .options(
-            selectinload(Project.proposals).load_only(Proposal.id),  # Only load IDs for count
-            raiseload(Project.files),
-            raiseload(Project.timeline),
-        )
-    )
+    # Build filtered query (loader options added after the total count)
+    query = select(Project).where(Project.user_id == current_user.id)
 
     # Add search filter
     if search:
@@ -98,6 +88,14 @@ async def list_projects(
     total_result = await db.execute(count_query)
     total = total_result.scalar()
 
+    # ✅ Count proposals in SQL instead of loading the collection
+    query = query.options(
+        undefer(Project._proposals_count),
+        raiseload(Project.proposals),
+        raiseload(Project.files),
+        raiseload(Project.timeline),
+    )
+
     # Apply pagination
     query = query.order_by(Project.updated_at.desc())
     query = query.offset((page - 1) * page_size).limit(page_size)
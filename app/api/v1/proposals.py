@@ -6,16 +6,24 @@ Includes PDF generation and AI transparency features (Oct 2025).
 
 from uuid import UUID
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import FileResponse, RedirectResponse, Response, StreamingResponse
 import logging
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select, update
+from sqlalchemy.orm import contains_eager, raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+import hashlib
 import io
+import os
 
+import orjson
+
+from app.core.config import settings
 from app.core.database import get_async_db
+from app.core.executors import pdf_generation_semaphore
 from app.api.dependencies import CurrentUser
 from app.models.project import Project
+from app.models.proposal import Proposal
 from app.schemas.proposal import (
     ProposalGenerationRequest,
     ProposalJobStatus,
@@ -23,9 +31,16 @@ from app.schemas.proposal import (
     AIMetadataResponse,
 )
 from app.schemas.common import ErrorResponse
+from app.services.cache_service import cache_service
 from app.services.proposal_service import ProposalService
 from app.visualization.pdf_generator import pdf_generator
-from app.services.s3_service import get_presigned_url, USE_S3
+from app.services.s3_service import (
+    LOCAL_UPLOADS_DIR,
+    USE_S3,
+    delete_file_from_storage,
+    get_presigned_url_cached,
+)
+from app.visualization.modern_charts import generate_executive_charts_async
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +49,202 @@ router = APIRouter()
 # Import rate limiter from main app
 from app.main import limiter
 
+# ⚡ Hot lookups as lambda statements: SQL construction/compilation is cached
+_PROPOSAL_BUNDLE = lambda_stmt(
+    lambda: select(Proposal)
+    .join(Proposal.project)
+    .where(
+        Proposal.id == bindparam("proposal_id"),
+        Proposal.project_id == bindparam("project_id"),
+        Project.user_id == bindparam("user_id"),
+    )
+    .options(
+        contains_eager(Proposal.project)
+        .load_only(Project.name, Project.client, Project.sector, Project.location)
+        .options(raiseload(Project.proposals), raiseload(Project.timeline))
+    )
+)
+_PROPOSAL_RESPONSE_FIELDS = tuple(ProposalResponse.model_fields)
+
+_PROJECT_OWNED_BY = lambda_stmt(
+    lambda: select(
+        select(Project.id)
+        .where(Project.id == bindparam("project_id"), Project.user_id == bindparam("user_id"))
+        .exists()
+    )
+)
+
+
+# Validated AI metadata per (proposal_id, payload digest); oldest evicted first
+_AI_METADATA_CACHE: Dict[Tuple[UUID, str], AIMetadataResponse] = {}
+_AI_METADATA_CACHE_MAX = 2048
+
+
+def _validate_ai_metadata(proposal_id: UUID, digest: str, raw_json: bytes) -> AIMetadataResponse:
+    """
+    Validate stored AI metadata once per proposal payload.
+
+    ai_metadata is written once at generation time, so polling the same
+    proposal reuses the validated model instead of re-running Pydantic.
+    Only the small key is kept; raw_json is read on a miss and not retained.
+    Returned instances are shared - treat them as read-only.
+    """
+    key = (proposal_id, digest)
+    validated = _AI_METADATA_CACHE.get(key)
+    if validated is None:
+        validated = AIMetadataResponse.model_validate_json(raw_json)
+        if len(_AI_METADATA_CACHE) >= _AI_METADATA_CACHE_MAX:
+            del _AI_METADATA_CACHE[next(iter(_AI_METADATA_CACHE))]
+        _AI_METADATA_CACHE[key] = validated
+    return validated
+
+
+def _proposal_response(proposal: Proposal) -> ProposalResponse:
+    """
+    Build a ProposalResponse from a stored row without validating it.
+
+    Rows were validated when written and ai_metadata is kept as the raw
+    dict; the response_model check on the way out still guards the schema.
+    """
+    return ProposalResponse.model_construct(
+        **{name: getattr(proposal, name) for name in _PROPOSAL_RESPONSE_FIELDS}
+    )
+
+
+def _build_pdf_metadata(proposal: Proposal, project) -> Dict[str, Any]:
+    """Build the PDF generator metadata (matches existing interface) from ai_metadata."""
+    technical_data = ((proposal.ai_metadata or {}).get("proposal") or {}).get("technicalData") or {}
+    return {
+        "data_for_charts": {
+            "client_info": {
+                "company_name": project.client,
+                "industry": project.sector,
+                "location": project.location,
+            },
+            "flow_rate_m3_day": 0,  # Extract from proposal data
+            "capex_usd": proposal.capex,
+            "annual_opex_usd": proposal.opex,
+            "main_equipment": technical_data.get("mainEquipment") or [],
+            "treatment_efficiency": technical_data.get("treatmentEfficiency") or {},
+            "capex_breakdown": technical_data.get("capexBreakdown") or {},
+            "opex_breakdown": technical_data.get("opexBreakdown") or {},
+            "problem_analysis": {},
+            "alternative_analysis": [],
+            "implementation_months": technical_data.get("implementationMonths") or 12,
+        }
+    }
+
+
+async def _get_pdf_metadata(proposal: Proposal, project) -> Dict[str, Any]:
+    """
+    Return PDF metadata, cached in Redis per (proposal_id, updated_at).
+
+    Repeated ?regenerate=true requests for an unchanged proposal reuse it.
+    """
+    cache_key = f"pdf:meta:{proposal.id}:{int(proposal.updated_at.timestamp())}"
+    metadata = await cache_service.get(cache_key)
+    if metadata is None:
+        metadata = _build_pdf_metadata(proposal, project)
+        await cache_service.set(cache_key, metadata, ttl=86400)
+    return metadata
+
+
+async def _pdf_download_response(pdf_path: str, proposal: Proposal, project) -> Optional[Response]:
+    """
+    Build the response for a stored PDF, or None if it is unavailable.
+
+    S3: 302 to a (cached) presigned URL. Local: FileResponse, saving the
+    redirect round-trip to /uploads.
+    """
+    if USE_S3:
+        pdf_url = await get_presigned_url_cached(pdf_path, expires=3600)
+        if not pdf_url:
+            return None
+        return RedirectResponse(url=pdf_url, status_code=302)  # Temporary redirect
+
+    local_path = os.path.join(LOCAL_UPLOADS_DIR, pdf_path)
+    if not os.path.exists(local_path):
+        return None
+    return FileResponse(
+        local_path,
+        media_type="application/pdf",
+        filename=f"Proposal_{proposal.version}_{project.name}.pdf",
+    )
+
+
+async def _delete_pdf_best_effort(pdf_path: str) -> None:
+    """Delete a proposal PDF from storage; log but never fail (file might already be deleted)."""
+    try:
+        await delete_file_from_storage(pdf_path)
+        await cache_service.delete(f"pdf:url:{pdf_path}")
+    except Exception as e:
+        logger.warning(f"Failed to delete PDF file {pdf_path}: {e}")
+
+
+# Clients may cache but must revalidate (cheap 304) before reuse
+_ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def _proposal_etag(proposal: Proposal) -> str:
+    """Weak ETag derived from the proposal revision (id + updated_at)."""
+    return f'W/"{proposal.id}-{int(proposal.updated_at.timestamp() * 1_000_000)}"'
+
+
+def _not_modified_response(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the request's If-None-Match matches etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    # Weak comparison (RFC 9110): ignore W/ prefixes, accept lists and "*"
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in candidates or etag.removeprefix("W/") in candidates:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": _ETAG_CACHE_CONTROL},
+        )
+    return None
+
+
+async def _load_proposal_bundle(
+    db: AsyncSession, project_id: UUID, proposal_id: UUID, user_id: UUID
+) -> Proposal:
+    """
+    Load a proposal with its project in one query, enforcing ownership.
+
+    The project is joined (only the columns the PDF needs) instead of being
+    fetched separately; its proposals/timeline are never loaded.
+
+    Raises:
+        HTTPException 404 if the proposal doesn't exist in a project owned by the user
+    """
+    result = await db.execute(
+        _PROPOSAL_BUNDLE,
+        {"proposal_id": proposal_id, "project_id": project_id, "user_id": user_id},
+    )
+    proposal = result.scalar_one_or_none()
+    if not proposal:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Proposal not found",
+        )
+    return proposal
+
+
+async def _ensure_project_owner(db: AsyncSession, project_id: UUID, user_id: UUID) -> None:
+    """
+    Raise 404 unless the project exists and belongs to the user.
+
+    Uses EXISTS so no Project row (or its selectin relationships) is loaded.
+    """
+    owns = await db.scalar(
+        _PROJECT_OWNED_BY, {"project_id": project_id, "user_id": user_id}
+    )
+    if not owns:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
 
 @router.post(
     "/generate",
@@ -84,19 +295,7 @@ async def generate_proposal(
     - **estimated_time**: Estimated completion time in seconds
     """
     # Verify project exists and belongs to user
-    result = await db.execute(
-        select(Project).where(
-            Project.id == proposal_request.project_id,
-            Project.user_id == current_user.id,
-        )
-    )
-    project = result.scalar_one_or_none()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
+    await _ensure_project_owner(db, proposal_request.project_id, current_user.id)
 
     # Start proposal generation
     job_id = await ProposalService.start_proposal_generation(
@@ -106,16 +305,24 @@ async def generate_proposal(
         user_id=current_user.id,
     )
 
-    # Add background task for processing
-    # Note: In production, this should be handled by Celery or similar
-    # IMPORTANT: Don't pass db session - background task will create its own
-    background_tasks.add_task(
-        ProposalService.generate_proposal_async_wrapper,
-        project_id=proposal_request.project_id,
-        request=proposal_request,
-        job_id=job_id,
-        user_id=current_user.id,
-    )
+    if settings.JOB_BACKEND == "celery":
+        # Run on a Celery worker so the API worker stays free for polling
+        await ProposalService.enqueue_proposal_generation(
+            project_id=proposal_request.project_id,
+            request=proposal_request,
+            job_id=job_id,
+            user_id=current_user.id,
+        )
+    else:
+        # Local development: run in-process after the response is sent
+        # IMPORTANT: Don't pass db session - background task will create its own
+        background_tasks.add_task(
+            ProposalService.generate_proposal_async_wrapper,
+            project_id=proposal_request.project_id,
+            request=proposal_request,
+            job_id=job_id,
+            user_id=current_user.id,
+        )
 
     logger.info(f"🚀 Proposal generation started: {job_id} for project {proposal_request.project_id}")
 
@@ -229,10 +436,8 @@ async def list_proposals(
     # Get proposals (relationship already loaded via selectin)
     proposals = project.proposals
 
-    # ✅ Convert to response models with snapshot using helper method
-    response_list = [ProposalResponse.from_model_with_snapshot(p) for p in proposals]
-
-    return response_list
+    # ✅ Trusted DB rows: construct without a second validation pass
+    return [_proposal_response(proposal) for proposal in proposals]
 
 
 @router.get(
@@ -242,6 +447,8 @@ async def list_proposals(
     summary="Get proposal detail",
 )
 async def get_proposal(
+    request: Request,
+    response: Response,
     project_id: UUID,
     proposal_id: UUID,
     current_user: CurrentUser,
@@ -251,40 +458,20 @@ async def get_proposal(
     Get detailed proposal information.
     
     Includes full markdown content, equipment specs, costs, and efficiency data.
+
+    Supports conditional GET: send `If-None-Match` with the last `ETag` to get
+    304 Not Modified when the proposal hasn't changed.
     """
-    # Verify project access
-    result = await db.execute(
-        select(Project).where(
-            Project.id == project_id,
-            Project.user_id == current_user.id,
-        )
-    )
-    project = result.scalar_one_or_none()
-    
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    
-    # Find proposal
-    from app.models.proposal import Proposal
-    result = await db.execute(
-        select(Proposal).where(
-            Proposal.id == proposal_id,
-            Proposal.project_id == project_id,
-        )
-    )
-    proposal = result.scalar_one_or_none()
-    
-    if not proposal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Proposal not found",
-        )
-    
-    # ✅ Build response with snapshot using helper method
-    return ProposalResponse.from_model_with_snapshot(proposal)
+    # Verify access and load proposal (single query)
+    proposal = await _load_proposal_bundle(db, project_id, proposal_id, current_user.id)
+
+    # ⚡ Conditional GET: skip validation/serialization if client copy is current
+    etag = _proposal_etag(proposal)
+    if not_modified := _not_modified_response(request, etag):
+        return not_modified
+    response.headers.update({"ETag": etag, "Cache-Control": _ETAG_CACHE_CONTROL})
+
+    return _proposal_response(proposal)
 
 
 @router.get(
@@ -335,118 +522,65 @@ async def get_proposal_pdf(
     - PDF file as `application/pdf`
     - Filename: `Proposal_{version}_{project_name}.pdf`
     """
-    # Verify project access
-    result = await db.execute(
-        select(Project).where(
-            Project.id == project_id,
-            Project.user_id == current_user.id,
-        )
-    )
-    project = result.scalar_one_or_none()
-    
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    
-    # Get proposal with relationships
-    from app.models.proposal import Proposal
-    result = await db.execute(
-        select(Proposal).where(
-            Proposal.id == proposal_id,
-            Proposal.project_id == project_id,
-        )
-    )
-    proposal = result.scalar_one_or_none()
-    
-    if not proposal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Proposal not found",
-        )
-    
-    # Load project relationship if not loaded
-    if not proposal.project:
-        proposal.project = project
-    
+    # Verify access and load proposal + project columns (single query)
+    proposal = await _load_proposal_bundle(db, project_id, proposal_id, current_user.id)
+    project = proposal.project
+
     try:
         # Check if PDF exists and regeneration not requested
         if proposal.pdf_path and not regenerate:
             logger.info(f"📄 Serving cached PDF for proposal {proposal_id}")
             
-            # Generate fresh presigned URL or serve local path
-            pdf_url = await get_presigned_url(proposal.pdf_path, expires=3600)
-            
-            if pdf_url:
-                # Redirect to presigned URL (S3) or local URL
-                from fastapi.responses import RedirectResponse
-                return RedirectResponse(
-                    url=pdf_url,
-                    status_code=302  # Temporary redirect
-                )
+            # Redirect to presigned URL (S3) or stream local file
+            response = await _pdf_download_response(proposal.pdf_path, proposal, project)
+            if response:
+                return response
         
         # Generate new PDF using existing ProfessionalPDFGenerator
         logger.info(f"🔄 Generating new PDF for proposal {proposal_id}")
         
-        # Prepare metadata for PDF generator (matches existing interface)
-        metadata = {
-            "data_for_charts": proposal.technical_data if hasattr(proposal, 'technical_data') else {
-                "client_info": {
-                    "company_name": project.client,
-                    "industry": project.sector,
-                    "location": project.location,
-                },
-                "flow_rate_m3_day": 0,  # Extract from proposal data
-                "capex_usd": proposal.capex,
-                "annual_opex_usd": proposal.opex,
-                "main_equipment": proposal.equipment_list or [],
-                "treatment_efficiency": proposal.treatment_efficiency or {},
-                "capex_breakdown": proposal.cost_breakdown or {},
-                "opex_breakdown": proposal.operational_costs or {},
-                "problem_analysis": {},
-                "alternative_analysis": [],
-                "implementation_months": 12,
-            }
-        }
-        
+        # Prepare metadata for PDF generator (memoized per proposal revision)
+        metadata = await _get_pdf_metadata(proposal, project)
+
         # ✅ Generate charts BEFORE creating PDF (like backend-chatbot)
-        from app.visualization.modern_charts import premium_chart_generator
-        
-        logger.info(f"📊 Generating executive charts for proposal {proposal_id}")
-        charts = premium_chart_generator.generate_executive_charts(metadata)
-        logger.info(f"📊 Generated {len(charts)} charts: {list(charts.keys()) if charts else 'none'}")
-        
-        # ✅ Generate PDF with charts (returns RELATIVE filename: "proposals/file.pdf")
-        pdf_filename = await pdf_generator.create_pdf(
-            markdown_content=proposal.technical_approach or "",
-            metadata=metadata,
-            charts=charts,  # ✅ Now with actual charts
-            conversation_id=str(proposal_id)
-        )
+        # Bounded: charts render in parallel in a process pool, PDF layout in a thread pool
+        async with pdf_generation_semaphore:
+            logger.info(f"📊 Generating executive charts for proposal {proposal_id}")
+            charts = await generate_executive_charts_async(metadata)
+            logger.info(f"📊 Generated {len(charts)} charts: {list(charts.keys()) if charts else 'none'}")
+
+            # ✅ Generate PDF with charts (returns RELATIVE filename: "proposals/file.pdf")
+            pdf_filename = await pdf_generator.create_pdf(
+                markdown_content=proposal.technical_approach or "",
+                metadata=metadata,
+                charts=charts,  # ✅ Now with actual charts
+                conversation_id=str(proposal_id)
+            )
 
         if not pdf_filename:
             raise ValueError("PDF generation returned None")
 
         # ✅ Save RELATIVE filename in database (NOT the full URL)
-        proposal.pdf_path = pdf_filename
+        # Targeted UPDATE: only pdf_path, no ORM flush of the loaded proposal
+        await db.execute(
+            update(Proposal)
+            .where(Proposal.id == proposal_id)
+            .values(pdf_path=pdf_filename)
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
 
         logger.info(f"✅ PDF generated and saved: {pdf_filename}")
 
-        # ✅ Generate download URL from relative filename
-        # In local mode: returns "/uploads/proposals/file.pdf"
-        # In S3 mode: returns presigned S3 URL
-        pdf_url = await get_presigned_url(pdf_filename, expires=3600)
+        # ✅ Serve from relative filename
+        # In S3 mode: 302 to presigned S3 URL
+        # In local mode: file streamed directly (no extra round-trip)
+        response = await _pdf_download_response(pdf_filename, proposal, project)
 
-        if not pdf_url:
+        if not response:
             raise ValueError("Failed to generate download URL")
 
-        from fastapi.responses import RedirectResponse
-        return RedirectResponse(
-            url=pdf_url,
-            status_code=302
-        )
+        return response
         
     except Exception as e:
         logger.error(f"❌ PDF generation failed: {e}", exc_info=True)
@@ -474,6 +608,7 @@ async def delete_proposal(
     project_id: UUID,
     proposal_id: UUID,
     current_user: CurrentUser,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_async_db),
 ):
     """
@@ -487,38 +622,10 @@ async def delete_proposal(
     **Best Practices (October 2025):**
     - Returns 204 No Content on success (RESTful standard)
     - Returns 404 if proposal doesn't exist (prevents info leakage)
-    - Atomic operation (DB + file deletion)
+    - PDF is removed only after the DB commit succeeds (after the response)
     """
-    # Verify project access and ownership
-    result = await db.execute(
-        select(Project).where(
-            Project.id == project_id,
-            Project.user_id == current_user.id,
-        )
-    )
-    project = result.scalar_one_or_none()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-
-    # Get proposal
-    from app.models.proposal import Proposal
-    result = await db.execute(
-        select(Proposal).where(
-            Proposal.id == proposal_id,
-            Proposal.project_id == project_id,
-        )
-    )
-    proposal = result.scalar_one_or_none()
-
-    if not proposal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Proposal not found",
-        )
+    # Verify access and load proposal (single query)
+    proposal = await _load_proposal_bundle(db, project_id, proposal_id, current_user.id)
 
     # Store pdf_path before deleting (for cleanup)
     pdf_path = proposal.pdf_path
@@ -527,24 +634,10 @@ async def delete_proposal(
     await db.delete(proposal)
     await db.commit()
 
-    # Delete PDF file from storage (best effort - don't fail if file doesn't exist)
+    # Storage cleanup only once the row is gone: a failed commit must leave
+    # the PDF in place. Runs after the response, so it adds no latency.
     if pdf_path:
-        try:
-            from app.services.s3_service import USE_S3, LOCAL_UPLOADS_DIR
-            import os
-
-            if USE_S3:
-                # TODO: Implement S3 deletion when S3 is configured
-                logger.info(f"📄 Would delete from S3: {pdf_path}")
-            else:
-                # Delete local file
-                local_file_path = os.path.join(LOCAL_UPLOADS_DIR, pdf_path)
-                if os.path.exists(local_file_path):
-                    os.remove(local_file_path)
-                    logger.info(f"🗑️ Deleted local PDF: {local_file_path}")
-        except Exception as e:
-            # Log error but don't fail the request (file might already be deleted)
-            logger.warning(f"Failed to delete PDF file {pdf_path}: {e}")
+        background_tasks.add_task(_delete_pdf_best_effort, pdf_path)
 
     logger.info(f"🗑️ Deleted proposal {proposal_id} from project {project_id}")
 
@@ -567,6 +660,7 @@ async def delete_proposal(
 @limiter.limit("60/minute")  # ⭐ Rate limit: Read operation (permissive)
 async def get_proposal_ai_metadata(
     request: Request,  # Required for rate limiter
+    response: Response,
     project_id: UUID,
     proposal_id: UUID,
     current_user: CurrentUser,
@@ -621,37 +715,18 @@ async def get_proposal_ai_metadata(
     **Frontend Integration:**
     Use this data in a "Validation" or "AI Insights" tab to show
     engineers the reasoning behind the proposal.
+
+    **Caching:** Responses carry an `ETag`; polling with `If-None-Match`
+    returns 304 Not Modified while the proposal is unchanged.
     """
-    # Verify project access
-    result = await db.execute(
-        select(Project).where(
-            Project.id == project_id,
-            Project.user_id == current_user.id,
-        )
-    )
-    project = result.scalar_one_or_none()
-    
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    
-    # Get proposal
-    from app.models.proposal import Proposal
-    result = await db.execute(
-        select(Proposal).where(
-            Proposal.id == proposal_id,
-            Proposal.project_id == project_id,
-        )
-    )
-    proposal = result.scalar_one_or_none()
-    
-    if not proposal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Proposal not found",
-        )
+    # Verify access and load proposal (single query)
+    proposal = await _load_proposal_bundle(db, project_id, proposal_id, current_user.id)
+
+    # ⚡ Conditional GET: skip validation/serialization if client copy is current
+    etag = _proposal_etag(proposal)
+    if not_modified := _not_modified_response(request, etag):
+        return not_modified
+    response.headers.update({"ETag": etag, "Cache-Control": _ETAG_CACHE_CONTROL})
     
     # ✅ Get AI metadata directly from PostgreSQL (single source of truth)
     ai_metadata = proposal.ai_metadata
@@ -664,8 +739,10 @@ async def get_proposal_ai_metadata(
         )
     
     try:
-        # Validate with Pydantic (catches corrupted data)
-        validated_metadata = AIMetadataResponse(**ai_metadata)
+        # Validate with Pydantic (catches corrupted data), cached per payload
+        raw_json = orjson.dumps(ai_metadata)
+        digest = hashlib.blake2b(raw_json, digest_size=8).hexdigest()
+        validated_metadata = _validate_ai_metadata(proposal_id, digest, raw_json)
         logger.info(
             f"✅ Returning validated AI metadata",
             extra={
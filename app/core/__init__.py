@@ -1,7 +1,8 @@
 """Core modules for application configuration and infrastructure."""
 
 from app.core.config import settings
-from app.core.database import Base, get_async_db, get_db
+from app.core.database import get_async_db, get_db
+from app.core.db_base import Base
 
 __all__ = [
     "settings",
@@ -28,6 +28,10 @@ async def get_user_db(
     
     This connects FastAPI Users to our SQLAlchemy async session and User model.
     
+    FastAPI caches get_async_db per request, so the adapter shares the
+    handler's session (one pooled connection per request) and the user
+    lookup reuses that connection's asyncpg prepared statement cache.
+    
     Args:
         session: Async database session from existing dependency
         
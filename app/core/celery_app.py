@@ -0,0 +1,34 @@
+"""
+Celery application for long-running background jobs.
+
+AI proposal generation takes 1-2 minutes. Running it through FastAPI
+BackgroundTasks keeps it inside the API worker, competing with polling,
+PDF and CRUD requests. With JOB_BACKEND=celery the work is queued on
+RabbitMQ and executed by a dedicated worker process instead.
+
+Run the worker with:
+    celery -A app.core.celery_app worker --loglevel=info
+"""
+
+from celery import Celery
+
+from app.core.config import settings
+
+celery_app = Celery(
+    "h2o_allegiant",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.celery_result_backend,
+    include=["app.services.proposal_tasks"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    result_serializer="json",
+    task_track_started=True,
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,  # One AI generation per worker slot
+    result_expires=3600,  # Match job status TTL in Redis
+    task_time_limit=900,  # Hard limit: 15 min (AI timeout is 8 min)
+    task_soft_time_limit=600,
+)
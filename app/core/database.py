@@ -3,48 +3,97 @@ Database session management.
 Provides SQLAlchemy session factory and dependency injection.
 """
 
+from functools import lru_cache
 from typing import AsyncGenerator, Generator
-from sqlalchemy import create_engine, event
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import Session, sessionmaker, declarative_base
-
-from app.core.config import settings
-
-# Create declarative base for models
-Base = declarative_base()
-
-# Sync engine (for Alembic migrations)
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=False,  # Disable SQL query logging to reduce noise
-)
-
-# Async engine (for FastAPI endpoints)
-async_engine = create_async_engine(
-    settings.async_database_url,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=False,  # Disable SQL query logging to reduce noise
-)
-
-# Session factories
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
-
-AsyncSessionLocal = async_sessionmaker(
-    async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+import logging
+import orjson
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.config import ASYNC_DATABASE_URL, DATABASE_URL
+from app.core.db_base import Base  # noqa: F401 - re-exported for compatibility
+
+logger = logging.getLogger(__name__)
+
+
+def _json_serializer(value) -> str:
+    """orjson encoder for JSON/JSONB binds (the asyncpg codec expects str)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Engines are created lazily on first use: importing this module (e.g. for
+# Base in models/Alembic) must not build connection pools or load drivers.
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Sync engine (for Alembic migrations and scripts)."""
+    return create_engine(
+        DATABASE_URL,
+        poolclass=NullPool,  # Short-lived, infrequent use: no idle pooled connections
+        echo=False,  # Disable SQL query logging to reduce noise
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Async engine (for FastAPI endpoints)."""
+    return create_async_engine(
+        ASYNC_DATABASE_URL,
+        # No pool_pre_ping: it costs a SELECT 1 round-trip on every checkout.
+        # Short recycle + TCP keepalives keep pooled connections healthy.
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=900,
+        pool_timeout=30,
+        echo=False,  # Disable SQL query logging to reduce noise
+        # JSON/JSONB columns (project_data, ai_metadata) encoded and decoded
+        # with orjson inside the dialect's asyncpg type codecs
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        connect_args={
+            "timeout": 10,  # Connection establishment
+            "command_timeout": 30,  # Per statement
+            # asyncpg prepared statements cached per pooled connection
+            "prepared_statement_cache_size": 500,
+            "server_settings": {
+                "application_name": "h2o-allegiant-api",
+                # Short OLTP queries: JIT compilation costs more than it saves
+                "jit": "off",
+                # Keepalives so idle connections aren't silently dropped by NAT/LB
+                "tcp_keepalives_idle": "60",
+                "tcp_keepalives_interval": "10",
+                "tcp_keepalives_count": "5",
+            },
+        },
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> sessionmaker[Session]:
+    """Sync session factory bound to the sync engine."""
+    return sessionmaker(
+        bind=get_engine(),
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Async session factory bound to the async engine."""
+    return async_sessionmaker(
+        get_async_engine(),
+        class_=AsyncSession,
+        # Keep loaded attributes after commit: under asyncio an expired attribute
+        # would need an implicit refresh SELECT (MissingGreenlet outside await).
+        # Call `await db.refresh(obj)` explicitly where fresh state is required.
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
 
 
 # Dependency for sync sessions (rarely used, mainly for migrations)
@@ -53,7 +102,7 @@ def get_db() -> Generator[Session, None, None]:
     Dependency for getting sync database session.
     Use for Alembic migrations or special cases.
     """
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
         db.commit()
@@ -75,7 +124,7 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
         async def get_projects(db: AsyncSession = Depends(get_async_db)):
             ...
     """
-    async with AsyncSessionLocal() as session:
+    async with get_async_sessionmaker()() as session:
         try:
             yield session
             await session.commit()
@@ -93,10 +142,24 @@ async def init_db() -> None:
     Creates all tables if they don't exist.
     Use only in development - in production use Alembic migrations.
     """
-    async with async_engine.begin() as conn:
+    async with get_async_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_db() -> None:
+    """
+    Open one pooled connection at startup so the first request doesn't pay
+    for connection setup. Failures are logged, not raised (same as Redis).
+    """
+    try:
+        async with get_async_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        logger.info("✅ Database connection pool warmed")
+    except Exception as e:
+        logger.error(f"❌ Database warm-up failed: {e}")
+
+
 async def close_db() -> None:
-    """Close database connections."""
-    await async_engine.dispose()
+    """Close database connections (no-op if the engine was never created)."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
@@ -0,0 +1,11 @@
+"""
+Declarative base for ORM models.
+
+Kept separate from app.core.database so models (and Alembic) can import
+Base without pulling in engine/session configuration.
+"""
+
+from sqlalchemy.orm import declarative_base
+
+# Create declarative base for models
+Base = declarative_base()
@@ -0,0 +1,61 @@
+"""
+Bounded executors for CPU-bound rendering work.
+
+Chart generation (matplotlib/plotly) and HTML-to-PDF rendering (WeasyPrint)
+are synchronous and CPU-heavy. Running them inside an async handler blocks the
+uvicorn event loop for every other request on the worker, so they are pushed
+to size-capped pools here:
+
+- Charts run in a process pool: matplotlib's pyplot state is not thread-safe.
+- PDF rendering runs in a thread pool.
+
+A semaphore caps how many PDF generations a single process runs at once.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+RENDER_WORKERS = min(4, os.cpu_count() or 1)
+
+# Limit concurrent PDF generations per process (charts + PDF layout)
+pdf_generation_semaphore = asyncio.Semaphore(RENDER_WORKERS)
+
+_chart_executor: Optional[ProcessPoolExecutor] = None
+_pdf_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_chart_executor() -> ProcessPoolExecutor:
+    """Process pool for chart rendering (created on first use)."""
+    global _chart_executor
+    if _chart_executor is None:
+        # forkserver: children don't inherit the event loop or DB pool sockets
+        _chart_executor = ProcessPoolExecutor(
+            max_workers=RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _chart_executor
+
+
+def get_pdf_executor() -> ThreadPoolExecutor:
+    """Thread pool for HTML-to-PDF rendering (created on first use)."""
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ThreadPoolExecutor(
+            max_workers=RENDER_WORKERS,
+            thread_name_prefix="pdf-render",
+        )
+    return _pdf_executor
+
+
+def shutdown_executors() -> None:
+    """Shut down rendering pools (called on application shutdown)."""
+    global _chart_executor, _pdf_executor
+    if _chart_executor is not None:
+        _chart_executor.shutdown(wait=False, cancel_futures=True)
+        _chart_executor = None
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(wait=False, cancel_futures=True)
+        _pdf_executor = None
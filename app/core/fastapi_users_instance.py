@@ -15,6 +15,7 @@ Best Practices:
 """
 
 import uuid
+from functools import lru_cache
 from fastapi_users import FastAPIUsers
 
 from app.models.user import User
@@ -29,13 +30,33 @@ fastapi_users = FastAPIUsers[User, uuid.UUID](
     [auth_backend],
 )
 
+
+@lru_cache(maxsize=None)
+def _current_user(
+    active: bool = False,
+    verified: bool = False,
+    superuser: bool = False,
+    optional: bool = False,
+):
+    """
+    Return one shared dependency callable per flag combination.
+
+    FastAPI's per-request dependency cache is keyed by the callable, so
+    reusing the same object means the JWT is decoded and the user loaded
+    once per request even if several routes/dependencies declare it.
+    """
+    return fastapi_users.current_user(
+        active=active, verified=verified, superuser=superuser, optional=optional
+    )
+
+
 # Dependency to get current active user
 # Use this in your routes to require authentication
 # Example:
 #   @router.get("/protected")
 #   async def protected_route(user: User = Depends(current_active_user)):
 #       return {"user_id": user.id}
-current_active_user = fastapi_users.current_user(active=True)
+current_active_user = _current_user(active=True)
 
 # Dependency to get current superuser
 # Use this in your admin routes
@@ -43,7 +64,7 @@ current_active_user = fastapi_users.current_user(active=True)
 #   @router.get("/admin")
 #   async def admin_route(user: User = Depends(current_superuser)):
 #       return {"admin": user.email}
-current_superuser = fastapi_users.current_user(active=True, superuser=True)
+current_superuser = _current_user(active=True, superuser=True)
 
 # Dependency to get current verified user
 # Use this when you need email verification
@@ -51,7 +72,7 @@ current_superuser = fastapi_users.current_user(active=True, superuser=True)
 #   @router.get("/verified-only")
 #   async def verified_route(user: User = Depends(current_verified_user)):
 #       return {"verified_user": user.email}
-current_verified_user = fastapi_users.current_user(active=True, verified=True)
+current_verified_user = _current_user(active=True, verified=True)
 
 # Optional: Get current user without raising exception if not authenticated
 # Returns None if not authenticated
@@ -61,4 +82,4 @@ current_verified_user = fastapi_users.current_user(active=True, verified=True)
 #       if user:
 #           return {"authenticated": True, "user_id": user.id}
 #       return {"authenticated": False}
-current_active_user_optional = fastapi_users.current_user(active=True, optional=True)
+current_active_user_optional = _current_user(active=True, optional=True)
@@ -0,0 +1,187 @@
+"""
+Rate limiting for the FastAPI Users auth endpoints.
+
+FastAPI Users auto-generates its routes, so @limiter.limit() decorators
+can't be applied; RateLimitMiddleware enforces per-path limits instead,
+counted in Redis (shared across ECS tasks) by the sliding-window script
+in cache_service.
+"""
+
+import math
+import time
+from typing import Optional
+
+import orjson
+import structlog
+from fastapi import Response
+from redis.commands.core import AsyncScript
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+AUTH_ENDPOINT_LIMITS = {
+    # Login/Register - Strict (brute force & spam prevention)
+    f"{settings.API_V1_PREFIX}/auth/jwt/login": "5/minute",
+    f"{settings.API_V1_PREFIX}/auth/register": "3/minute",
+    f"{settings.API_V1_PREFIX}/auth/forgot-password": "3/minute",
+    f"{settings.API_V1_PREFIX}/auth/reset-password": "3/minute",
+
+    # Profile access - Generous (frequent legitimate use)
+    f"{settings.API_V1_PREFIX}/auth/me": "60/minute",
+
+    # Verification - Moderate
+    f"{settings.API_V1_PREFIX}/auth/verify": "10/minute",
+    f"{settings.API_V1_PREFIX}/auth/request-verify-token": "5/minute",
+}
+
+_PERIOD_MS = {"second": 1_000, "minute": 60_000, "hour": 3_600_000}
+
+
+def _parse_limit(limit_str: str) -> tuple[int, int]:
+    """Parse "5/minute" into (count, window_ms)."""
+    count, period = limit_str.split("/")
+    return int(count), _PERIOD_MS[period]
+
+
+# path -> (count, window_ms, redis key prefix), parsed once at import
+PARSED_AUTH_LIMITS: dict[str, tuple[int, int, str]] = {
+    path: (*_parse_limit(limit_str), f"rl:{path}:")
+    for path, limit_str in AUTH_ENDPOINT_LIMITS.items()
+}
+
+# Redis rate limit script, bound in lifespan once Redis is connected
+_rate_limit_script: Optional[AsyncScript] = None
+
+
+def set_rate_limit_script(script: Optional[AsyncScript]) -> None:
+    """Bind (or clear, with None) the Redis script used by the middleware."""
+    global _rate_limit_script
+    _rate_limit_script = script
+
+
+_TRUSTED_PROXY = settings.TRUSTED_PROXY
+_RL_METHODS = frozenset(("GET", "POST", "PATCH", "DELETE"))
+
+# Per-process cache of clients already denied in the current window:
+# (path, client_ip) -> monotonic deadline. Repeat offenders get a 429
+# without a Redis round-trip. Insertion-ordered, oldest entry evicted.
+_DENY_UNTIL: dict[tuple[str, str], float] = {}
+_DENY_CACHE_MAX = 10_000
+
+
+# 429 body serialized once; only Retry-After varies per response
+_DENY_BODY = orjson.dumps(
+    {
+        "error": {
+            "message": "Too many requests. Please try again later.",
+            "code": "RATE_LIMIT_EXCEEDED",
+        }
+    }
+)
+
+
+def _rate_limited_response(retry_after: int) -> Response:
+    """429 response for the auth endpoint limits."""
+    return Response(
+        content=_DENY_BODY,
+        status_code=429,
+        media_type="application/json",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+async def _check_auth_rate_limit(path: str, client_ip: str) -> Optional[int]:
+    """
+    Count this request against the auth endpoint limit.
+
+    Returns the Retry-After seconds if the client is over the limit,
+    None if the request may proceed (including when Redis is unavailable).
+    """
+    count, window_ms, key_prefix = PARSED_AUTH_LIMITS[path]
+
+    # Already denied in this window: reject without touching Redis
+    deny_key = (path, client_ip)
+    deny_until = _DENY_UNTIL.get(deny_key)
+    if deny_until is not None:
+        remaining = deny_until - time.monotonic()
+        if remaining > 0:
+            return math.ceil(remaining)
+        del _DENY_UNTIL[deny_key]
+
+    # Use Redis for distributed rate limiting
+    if _rate_limit_script is None:
+        # Fallback: If Redis unavailable, allow request (fail open)
+        # This prevents blocking users if Redis is down
+        logger.warning(f"Redis unavailable for rate limiting, allowing request: {path}")
+        return None
+
+    # Sliding window check + increment via EVALSHA
+    allowed, current_count, retry_ms = await _rate_limit_script(
+        keys=[key_prefix + client_ip], args=[window_ms, count]
+    )
+    if allowed:
+        return None
+
+    logger.warning(f"Rate limit exceeded: {path} from {client_ip} ({current_count}/{count})")
+    if len(_DENY_UNTIL) >= _DENY_CACHE_MAX:
+        del _DENY_UNTIL[next(iter(_DENY_UNTIL))]
+    _DENY_UNTIL[deny_key] = time.monotonic() + retry_ms / 1000
+    return math.ceil(retry_ms / 1000)
+
+
+def _client_ip(scope: Scope) -> str:
+    """
+    Client IP for rate limiting, read straight from the ASGI scope.
+
+    Behind a trusted proxy (ALB) the last X-Forwarded-For entry is the
+    address the proxy saw; earlier entries are client-supplied and
+    spoofable. Otherwise the socket peer is used, as get_remote_address does.
+    """
+    if _TRUSTED_PROXY:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                return value.rsplit(b",", 1)[-1].strip().decode("latin-1")
+    client = scope.get("client")
+    return client[0] if client else "127.0.0.1"
+
+
+class RateLimitMiddleware:
+    """
+    Apply granular rate limits to auth endpoints using Redis.
+    Redis-backed for distributed rate limiting across multiple ECS tasks.
+    Custom endpoints use @limiter.limit() decorators instead.
+
+    Pure ASGI middleware (no BaseHTTPMiddleware): requests are passed
+    through in-line, without a task group or response buffering.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in _RL_METHODS
+            or scope["path"] not in PARSED_AUTH_LIMITS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            retry_after = await _check_auth_rate_limit(scope["path"], _client_ip(scope))
+        except Exception as e:
+            logger.error(f"Rate limit check failed: {e}")
+            # Don't block request if rate limiting fails (fail open for availability)
+            retry_after = None
+
+        if retry_after is not None:
+            await _rate_limited_response(retry_after)(scope, receive, send)
+            return
+
+        # Note: expires_in injection removed - causes Content-Length mismatch
+        # Frontend now hardcodes expires_in = 86400 (24h) in auth.ts
+        # TODO: Implement custom login endpoint if dynamic expires_in is needed
+        await self.app(scope, receive, send)
@@ -0,0 +1,40 @@
+"""
+JSON response class used app-wide.
+
+ORJSONResponse with a `default=` hook: orjson encodes UUID, datetime,
+dataclasses and enums natively in C, and the hook covers the rest
+(Decimal, sets, exceptions in validation error contexts), so handlers can
+pass plain `model_dump()` output instead of a pre-stringified
+`model_dump(mode="json")`.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def json_default(obj: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    return str(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to JSON bytes with the app-wide orjson options."""
+    return orjson.dumps(content, default=json_default, option=_ORJSON_OPTIONS)
+
+
+class AppJSONResponse(ORJSONResponse):
+    """ORJSONResponse that falls back to json_default for unknown types."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
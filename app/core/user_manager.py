@@ -16,9 +16,9 @@ Best Practices:
 """
 
 import uuid
-import logging
 from typing import Optional, AsyncGenerator
 
+import structlog
 from fastapi import Depends, Request
 from fastapi_users import BaseUserManager, UUIDIDMixin
 from fastapi_users.db import SQLAlchemyUserDatabase
@@ -27,7 +27,7 @@ from app.models.user import User
 from app.core.config import settings
 from app.core.auth_db import get_user_db
 
-logger = logging.getLogger(__name__)
+logger = structlog.get_logger(__name__)
 
 
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
@@ -66,12 +66,10 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             request: Optional request object for context
         """
         logger.info(
-            f"✅ User registered successfully",
-            extra={
-                "user_id": str(user.id),
-                "email": user.email,
-                "full_name": user.full_name
-            }
+            "user_registered",
+            user_id=str(user.id),
+            email=user.email,
+            full_name=user.full_name,
         )
         
         # TODO: Send welcome email
@@ -97,11 +95,9 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             request: Optional request object for context
         """
         logger.info(
-            f"🔑 Password reset requested",
-            extra={
-                "user_id": str(user.id),
-                "email": user.email
-            }
+            "password_reset_requested",
+            user_id=str(user.id),
+            email=user.email,
         )
         
         # TODO: Send password reset email
@@ -127,11 +123,9 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             request: Optional request object for context
         """
         logger.info(
-            f"📧 Email verification requested",
-            extra={
-                "user_id": str(user.id),
-                "email": user.email
-            }
+            "email_verification_requested",
+            user_id=str(user.id),
+            email=user.email,
         )
         
         # TODO: Send verification email
@@ -151,11 +145,9 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             request: Optional request object for context
         """
         logger.info(
-            f"✅ Email verified successfully",
-            extra={
-                "user_id": str(user.id),
-                "email": user.email
-            }
+            "email_verified",
+            user_id=str(user.id),
+            email=user.email,
         )
 
     async def on_after_update(
@@ -173,12 +165,10 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             request: Optional request object for context
         """
         logger.info(
-            f"✏️ User profile updated",
-            extra={
-                "user_id": str(user.id),
-                "email": user.email,
-                "updated_fields": list(update_dict.keys())
-            }
+            "user_profile_updated",
+            user_id=str(user.id),
+            email=user.email,
+            updated_fields=list(update_dict.keys()),
         )
 
 
@@ -2,23 +2,28 @@
 H2O Allegiant Backend - Main application entry point.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import logging
+from logging.handlers import RotatingFileHandler
 import os
 from pathlib import Path
+import orjson
 import structlog
 
-from app.core.config import settings
-from app.core.database import init_db, close_db
+from app.core.config import CORS_ORIGINS_LIST, REDIS_URL, settings
+from app.core.executors import shutdown_executors
+from app.core.rate_limit import RateLimitMiddleware, set_rate_limit_script
+from app.core.responses import AppJSONResponse
 from app.schemas.common import ErrorResponse, APIError
+from app.services.cache_service import cache_service
 
 # ============================================================================
 # Structured Logging Configuration (Best Practice 2025)
@@ -30,76 +35,100 @@ from app.schemas.common import ErrorResponse, APIError
 # - Integration with observability tools (Datadog, Grafana, CloudWatch)
 # ============================================================================
 
+def _orjson_dumps(obj, **kwargs) -> str:
+    """orjson-backed serializer for structlog's JSONRenderer (str for logging handlers)."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _format_exception_info(logger, method_name, event_dict):
+    """Render stack/exception info only for events that carry it (one check, not two processors)."""
+    if "exc_info" in event_dict or "stack_info" in event_dict:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+# Processors shared by structlog loggers and stdlib ("foreign") log records.
+# Kept minimal: every processor is a Python call on every log line.
+SHARED_PROCESSORS = (
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    _format_exception_info,
+)
+
 if settings.ENVIRONMENT == "production":
-    # Production: JSON output for log aggregation
-    processors = [
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),  # JSON output
-    ]
+    # Production: JSON output for log aggregation (orjson encoder)
+    renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
 else:
     # Development: Human-readable colored output
-    processors = [
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.dev.ConsoleRenderer(),  # Colored output
-    ]
+    renderer = structlog.dev.ConsoleRenderer()
 
 structlog.configure(
-    processors=processors,
+    processors=(
+        structlog.stdlib.filter_by_level,
+        *SHARED_PROCESSORS,
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+    ),
     wrapper_class=structlog.stdlib.BoundLogger,
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
-# Configure standard library logging (for libraries that use it)
-logging.basicConfig(
-    level=settings.LOG_LEVEL,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(settings.LOG_FILE),
-        logging.StreamHandler(),
-    ],
+# Standard library logging (for libraries that use it) renders through the
+# same structlog chain, so every line is formatted exactly once
+log_formatter = structlog.stdlib.ProcessorFormatter(
+    foreign_pre_chain=(*SHARED_PROCESSORS, structlog.stdlib.ExtraAdder()),
+    processors=(
+        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+        renderer,
+    ),
 )
+log_handlers = [logging.StreamHandler()]
+if settings.ENVIRONMENT != "test":
+    # Log directory must exist before the handler opens the file
+    Path(settings.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+    # delay=True: the file is opened on first write, not on import
+    # (Alembic, scripts and workers importing app.main never touch it)
+    log_handlers.append(
+        RotatingFileHandler(
+            settings.LOG_FILE,
+            maxBytes=50_000_000,
+            backupCount=5,
+            delay=True,
+        )
+    )
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+logging.basicConfig(level=settings.LOG_LEVEL, handlers=log_handlers)
 
 # Get structured logger for this module
 logger = structlog.get_logger(__name__)
 
-# Ensure log directory exists
-os.makedirs(os.path.dirname(settings.LOG_FILE), exist_ok=True)
-
-# Rate Limiter Configuration (slowapi with Redis backend)
-# Redis-backed storage for distributed rate limiting across multiple ECS tasks
-# This ensures rate limits work correctly when auto-scaling (>1 task)
-def get_redis_url() -> str:
-    """Get Redis URL for rate limiter storage."""
-    if settings.REDIS_PASSWORD:
-        return f"redis://:{settings.REDIS_PASSWORD}@{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
-    return f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
-
-# Use Redis storage if available, fallback to in-memory for local dev
-try:
+# Rate Limiter Configuration (slowapi)
+# Deployed environments: Redis-backed storage for distributed rate limiting
+# across multiple ECS tasks (limits hold when auto-scaling >1 task).
+# Local development: in-memory storage, no Redis dependency.
+if settings.ENVIRONMENT in ("production", "staging"):
     limiter = Limiter(
         key_func=get_remote_address,
-        storage_uri=get_redis_url(),
-        strategy="fixed-window"
+        storage_uri=REDIS_URL,
+        # Fail fast on an unreachable Redis instead of hanging requests
+        storage_options={"socket_connect_timeout": 2, "socket_timeout": 2},
+        strategy="fixed-window",
+        key_prefix="rl",
+        # Counters are shared via Redis; if Redis drops at runtime, keep
+        # limiting per-process instead of failing the request
+        in_memory_fallback_enabled=True,
     )
     logger.info("✅ Rate limiter initialized with Redis backend (distributed)")
-except Exception as e:
-    # Fallback to in-memory for local development
-    logger.warning(f"⚠️ Redis unavailable, using in-memory rate limiting: {e}")
-    limiter = Limiter(key_func=get_remote_address)
+else:
+    limiter = Limiter(key_func=get_remote_address, strategy="fixed-window")
     logger.info("✅ Rate limiter initialized with in-memory storage (local only)")
 
 
@@ -124,13 +153,16 @@ async def lifespan(app: FastAPI):
     #     logger.warning("Debug mode: initializing database tables...")
     #     await init_db()
     
-    # Initialize Redis cache
-    from app.services.cache_service import cache_service
-    await cache_service.connect()
+    # Connect Redis and warm the DB pool concurrently (both I/O-bound)
+    from app.core.database import warm_db
+    await asyncio.gather(cache_service.connect(), warm_db())
+    
+    # Bind the rate limit script for the auth middleware (None if Redis is down)
+    set_rate_limit_script(cache_service._rate_limit_script)
     
     # Ensure storage directory exists
     if settings.USE_LOCAL_STORAGE:
-        os.makedirs(settings.LOCAL_STORAGE_PATH, exist_ok=True)
+        Path(settings.LOCAL_STORAGE_PATH).mkdir(parents=True, exist_ok=True)
         logger.info(f"Local storage path: {settings.LOCAL_STORAGE_PATH}")
     
     logger.info("✅ Application started successfully")
@@ -138,9 +170,13 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    from app.core.database import close_db
+
     logger.info("🛑 Shutting down application...")
     await close_db()
+    set_rate_limit_script(None)
     await cache_service.close()
+    shutdown_executors()
     logger.info("✅ Application shutdown complete")
 
 
@@ -153,6 +189,7 @@ app = FastAPI(
     redoc_url=f"{settings.API_V1_PREFIX}/redoc",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     lifespan=lifespan,
+    default_response_class=AppJSONResponse,  # ⚡ orjson encoder for all JSON responses
     # Note: response_model_by_alias removed - FastAPI Users doesn't use aliases
     # Frontend transforms snake_case to camelCase in auth.ts
     # response_model_by_alias=True,  # ← Removed: causes Content-Length mismatch
@@ -165,7 +202,7 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=CORS_ORIGINS_LIST,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -177,91 +214,14 @@ app.add_middleware(
 # Rate Limiting Middleware for FastAPI Users Endpoints
 # ============================================================================
 # FastAPI Users auto-generates endpoints, so we can't use @limiter.limit()
-# decorators. Instead, we use middleware to apply granular limits by path.
+# decorators. Instead, we use middleware to apply granular limits by path
+# (limits and middleware live in app.core.rate_limit).
 # ============================================================================
 
-AUTH_ENDPOINT_LIMITS = {
-    # Login/Register - Strict (brute force & spam prevention)
-    f"{settings.API_V1_PREFIX}/auth/jwt/login": "5/minute",
-    f"{settings.API_V1_PREFIX}/auth/register": "3/minute",
-    f"{settings.API_V1_PREFIX}/auth/forgot-password": "3/minute",
-    f"{settings.API_V1_PREFIX}/auth/reset-password": "3/minute",
-
-    # Profile access - Generous (frequent legitimate use)
-    f"{settings.API_V1_PREFIX}/auth/me": "60/minute",
-
-    # Verification - Moderate
-    f"{settings.API_V1_PREFIX}/auth/verify": "10/minute",
-    f"{settings.API_V1_PREFIX}/auth/request-verify-token": "5/minute",
-}
-
-
-@app.middleware("http")
-async def granular_rate_limit_middleware(request: Request, call_next):
-    """
-    Apply granular rate limits to auth endpoints using Redis.
-    Redis-backed for distributed rate limiting across multiple ECS tasks.
-    Custom endpoints use @limiter.limit() decorators instead.
-    """
-    path = request.url.path
-    method = request.method
-
-    # Check if this endpoint has a specific rate limit
-    if path in AUTH_ENDPOINT_LIMITS and method in ["GET", "POST", "PATCH", "DELETE"]:
-        limit_str = AUTH_ENDPOINT_LIMITS[path]
-
-        try:
-            # Parse limit string (e.g., "5/minute")
-            count, period = limit_str.split("/")
-            count = int(count)
-            
-            # Get client IP
-            client_ip = get_remote_address(request)
-            
-            # Create cache key for Redis
-            cache_key = f"rate_limit:{path}:{client_ip}"
-            
-            # Use Redis for distributed rate limiting
-            from app.services.cache_service import cache_service
-            
-            if cache_service._redis:
-                # Increment counter in Redis
-                current_count = await cache_service._redis.incr(cache_key)
-                
-                # Set expiration on first request (60 seconds for "per minute")
-                if current_count == 1:
-                    await cache_service._redis.expire(cache_key, 60)
-                
-                # Check if limit exceeded
-                if current_count > count:
-                    logger.warning(f"Rate limit exceeded: {path} from {client_ip} ({current_count}/{count})")
-                    return JSONResponse(
-                        status_code=429,
-                        content={
-                            "error": {
-                                "message": "Too many requests. Please try again later.",
-                                "code": "RATE_LIMIT_EXCEEDED",
-                            }
-                        },
-                        headers={"Retry-After": "60"}
-                    )
-            else:
-                # Fallback: If Redis unavailable, allow request (fail open)
-                # This prevents blocking users if Redis is down
-                logger.warning(f"Redis unavailable for rate limiting, allowing request: {path}")
-
-        except Exception as e:
-            logger.error(f"Rate limit check failed: {e}")
-            # Don't block request if rate limiting fails (fail open for availability)
-
-    # Continue with request
-    response = await call_next(request)
-    
-    # Note: expires_in injection removed - causes Content-Length mismatch
-    # Frontend now hardcodes expires_in = 86400 (24h) in auth.ts
-    # TODO: Implement custom login endpoint if dynamic expires_in is needed
-    
-    return response
+# Registered app-wide rather than on a mounted auth sub-app: a sub-app would
+# drop the auth routes from /docs and bypass the exception handlers below.
+# Non-auth traffic costs one method/path set lookup.
+app.add_middleware(RateLimitMiddleware)
 
 
 # Note: Rate limiting strategy
@@ -277,7 +237,7 @@ async def granular_rate_limit_middleware(request: Request, call_next):
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> AppJSONResponse:
     """Handle validation errors with proper error response format."""
     logger.error(f"Validation error: {exc.errors()}")
     
@@ -289,9 +249,9 @@ async def validation_exception_handler(
         )
     )
     
-    return JSONResponse(
+    return AppJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump(mode="json"),
+        content=error_response.model_dump(),  # ctx objects handled by json_default
     )
 
 
@@ -299,7 +259,7 @@ async def validation_exception_handler(
 async def general_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> AppJSONResponse:
     """Handle unexpected errors."""
     logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
     
@@ -311,9 +271,9 @@ async def general_exception_handler(
         )
     )
     
-    return JSONResponse(
+    return AppJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode="json"),
+        content=error_response.model_dump(),  # orjson encodes the datetime natively
     )
 
 
@@ -337,43 +297,23 @@ async def root():
 
 
 # Import and include routers
+# (imported here, not at the top: the routers import `limiter` from this module)
 from app.api.v1 import auth, health, projects, proposals, files, project_data
 
-# Health checks (available at root and API prefix)
-app.include_router(
-    health.router,
-    tags=["Health"],
-)
+_API = settings.API_V1_PREFIX
 
-app.include_router(
-    auth.router,
-    prefix=f"{settings.API_V1_PREFIX}/auth",
-    tags=["Authentication"],
+# (router, prefix, tags) - health checks are served at the root
+ROUTERS = (
+    (health.router, "", ["Health"]),
+    (auth.router, f"{_API}/auth", ["Authentication"]),
+    (projects.router, f"{_API}/projects", ["Projects"]),
+    (files.router, f"{_API}/projects", ["Files"]),
+    (proposals.router, f"{_API}/ai/proposals", ["AI Proposals"]),
+    (project_data.router, f"{_API}/projects", ["Project Data"]),
 )
 
-app.include_router(
-    projects.router,
-    prefix=f"{settings.API_V1_PREFIX}/projects",
-    tags=["Projects"],
-)
-
-app.include_router(
-    files.router,
-    prefix=f"{settings.API_V1_PREFIX}/projects",
-    tags=["Files"],
-)
-
-app.include_router(
-    proposals.router,
-    prefix=f"{settings.API_V1_PREFIX}/ai/proposals",
-    tags=["AI Proposals"],
-)
-
-app.include_router(
-    project_data.router,
-    prefix=f"{settings.API_V1_PREFIX}/projects",
-    tags=["Project Data"],
-)
+for router, prefix, tags in ROUTERS:
+    app.include_router(router, prefix=prefix, tags=tags)
 
 # ============================================================================
 # Static Files (Development Only)
@@ -381,10 +321,9 @@ app.include_router(
 # Serve uploaded files (PDFs, images) in development mode
 # In production, these are served directly from S3
 # ============================================================================
-UPLOADS_DIR = Path(__file__).parent.parent / "uploads"
-UPLOADS_DIR.mkdir(exist_ok=True, parents=True)
-
 if not os.getenv("S3_BUCKET"):  # Only in local development
+    UPLOADS_DIR = Path(__file__).resolve().parent.parent / "uploads"
+    UPLOADS_DIR.mkdir(exist_ok=True, parents=True)
     app.mount("/uploads", StaticFiles(directory=str(UPLOADS_DIR)), name="uploads")
     logger.info(f"Local storage path: {UPLOADS_DIR}")
 
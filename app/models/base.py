@@ -2,13 +2,11 @@
 Base model with common fields and utilities.
 """
 
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
-from app.core.database import Base as DeclarativeBase
+from app.core.db_base import Base as DeclarativeBase
 
 
 class BaseModel(DeclarativeBase):
@@ -22,10 +20,8 @@ class BaseModel(DeclarativeBase):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        unique=True,
+        server_default=text("gen_random_uuid()"),  # Generated by PostgreSQL
         nullable=False,
-        index=True,
     )
     
     created_at = Column(
@@ -41,9 +37,21 @@ class BaseModel(DeclarativeBase):
         nullable=False,
     )
     
+    @classmethod
+    def _column_names(cls) -> tuple[str, ...]:
+        """Column names of this model's table (computed once per class)."""
+        names = cls.__dict__.get("_COLUMN_NAMES")
+        if names is None:
+            names = tuple(column.name for column in cls.__table__.columns)
+            cls._COLUMN_NAMES = names
+        return names
+    
     def to_dict(self) -> dict:
-        """Convert model to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        """
+        Convert model to dictionary.
+        
+        Reads loaded values straight from the instance state (no attribute
+        instrumentation, never triggers a lazy load); unloaded columns are None.
+        """
+        state = self.__dict__
+        return {name: state.get(name) for name in self._column_names()}
@@ -3,7 +3,7 @@ Project file model.
 Represents uploaded files associated with projects.
 """
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
@@ -35,7 +35,6 @@ class ProjectFile(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     
     # File Information
@@ -48,7 +47,7 @@ class ProjectFile(BaseModel):
     )
     
     file_size = Column(
-        Integer,
+        BigInteger,
         nullable=True,
         comment="File size in bytes",
     )
@@ -101,6 +100,16 @@ class ProjectFile(BaseModel):
         comment="Additional metadata (page count, dimensions, etc.)",
     )
     
+    # Latest files per project come straight off the index (no sort);
+    # also serves plain project_id lookups
+    __table_args__ = (
+        Index(
+            "ix_project_files_project_created",
+            "project_id",
+            text("created_at DESC"),
+        ),
+    )
+    
     # Relationships
     project = relationship("Project", back_populates="files")
     
@@ -102,9 +102,15 @@ class Project(BaseModel):
         comment="Flexible JSONB storage for all project technical data"
     )
     
-    # Index for JSONB queries
+    # Index for JSONB containment (@>) queries; jsonb_path_ops is ~half the
+    # size of the default opclass (no ?, ?|, ?& key-existence support)
     __table_args__ = (
-        Index('ix_project_data_gin', 'project_data', postgresql_using='gin'),
+        Index(
+            'ix_project_data_gin',
+            'project_data',
+            postgresql_using='gin',
+            postgresql_ops={'project_data': 'jsonb_path_ops'},
+        ),
     )
     
     # Relationships
@@ -123,7 +129,8 @@ class Project(BaseModel):
         back_populates="project",
         cascade="all, delete-orphan",
         order_by="desc(ProjectFile.created_at)",
-        lazy="dynamic",
+        lazy="raise",  # Query ProjectFile directly (paginated) or selectinload
+        passive_deletes=True,  # FK is ON DELETE CASCADE; don't load files to delete
     )
     
     timeline = relationship(
@@ -139,5 +146,15 @@ class Project(BaseModel):
 
     @property
     def proposals_count(self) -> int:
-        """Count of proposals for this project."""
-        return len(self.proposals) if self.proposals else 0
+        """
+        Count of proposals for this project.
+        
+        Uses the SQL count (Project._proposals_count) when the query
+        undeferred it, else the loaded proposals collection. Never
+        triggers a lazy load.
+        """
+        state = self.__dict__
+        if "_proposals_count" in state:
+            return state["_proposals_count"] or 0
+        proposals = state.get("proposals")
+        return len(proposals) if proposals else 0
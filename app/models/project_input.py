@@ -12,15 +12,40 @@ Best practices:
 - Supports any industry/sector
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import Field, ConfigDict, field_validator
+import io
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+import orjson
+from pydantic import Field, ConfigDict, PrivateAttr, TypeAdapter, field_validator
 from app.schemas.common import BaseSchema
-import logging
 
-logger = logging.getLogger(__name__)
+# Markdown fragments for to_ai_prompt_format
+_PROJECT_HEADER = "# PROYECTO: "
+_CLIENT_PREFIX = "\n**Cliente:** "
+_SECTOR_PREFIX = "\n**Sector:** "
+_LOCATION_PREFIX = "\n**Ubicación:** "
+_SECTION_PREFIX = "## "
+_FIELD_PREFIX = "- **"
+_FIELD_SEPARATOR = "**: "
 
+# Overview keys for format_ai_context_to_string, in output order
+_BASIC_FIELDS: Tuple[str, ...] = ("project_name", "client", "sector", "location", "budget_usd")
+# (key, label) pairs: project_name -> "Project Name"
+_BASIC_FIELD_LABELS: Tuple[Tuple[str, str], ...] = tuple(
+    (key, key.replace("_", " ").title()) for key in _BASIC_FIELDS
+)
 
-class DynamicField(BaseSchema):
+
+@lru_cache(maxsize=256)
+def _format_budget(budget: float) -> str:
+    """Budget as "$1,234.50 USD" (memoized: one project formats it repeatedly)."""
+    return f"${budget:,.2f} USD"
+
+
+@dataclass(slots=True, frozen=True)
+class DynamicField:
     """
     Represents a single dynamic technical field (e.g., a contaminant, parameter).
 
@@ -29,6 +54,11 @@ class DynamicField(BaseSchema):
     - Regulations: "NOM-001-SEMARNAT-2021"
     - Notes: "Observaciones de campo"
 
+    A slotted, frozen dataclass rather than a Pydantic model: projects
+    carry hundreds of fields and they are read-only after loading.
+    DynamicSection still validates dicts into it (pydantic-core builds
+    stdlib dataclasses natively, ignoring extra keys).
+
     Attributes:
         id: Unique identifier (e.g., "cromo-hexavalente")
         label: Human-readable name (e.g., "Cromo Hexavalente")
@@ -40,18 +70,14 @@ class DynamicField(BaseSchema):
         notes: Optional engineer's notes providing context for this field
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
-    id: str = Field(description="Unique field identifier")
-    label: str = Field(description="Human-readable field name")
-    value: Any = Field(description="Field value (flexible type)")
-    unit: Optional[str] = Field(default=None, description="Unit of measurement")
-    type: str = Field(default="text", description="Field type: text, number, unit, select")
-    source: str = Field(default="manual", description="Data source: manual, imported, ai")
-    importance: Optional[str] = Field(
-        default=None, description="Priority: critical, recommended, optional"
-    )
-    notes: Optional[str] = Field(default=None, description="Engineer's notes for this field")
+    id: str
+    label: str
+    value: Any
+    unit: Optional[str] = None
+    type: str = "text"
+    source: str = "manual"
+    importance: Optional[str] = None
+    notes: Optional[str] = None
 
     def format_value(self) -> str:
         """Format value with unit for display."""
@@ -77,23 +103,27 @@ class DynamicSection(BaseSchema):
         description: Optional description
         fields: List of dynamic fields in this section
         notes: Optional section-level notes
+
+    Frozen like its DynamicField children, so a cached to_ai_context()
+    can't be invalidated by editing a section in place.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
 
     id: str = Field(description="Section identifier")
     title: str = Field(description="Section title")
     description: Optional[str] = Field(default=None, description="Section description")
-    fields: List[DynamicField] = Field(default_factory=list, description="Fields in this section")
+    fields: Sequence[DynamicField] = Field(default=(), description="Fields in this section")
     notes: Optional[str] = Field(default=None, description="Section notes")
 
-    @field_validator("fields", mode="before")
+    @field_validator("fields", mode="after")
     @classmethod
-    def convert_field_dicts(cls, v: Any) -> List[DynamicField]:
-        """Convert dict representations to DynamicField instances."""
-        if isinstance(v, list):
-            return [DynamicField(**item) if isinstance(item, dict) else item for item in v]
-        return v
+    def freeze_fields(cls, v: Sequence[DynamicField]) -> Tuple[DynamicField, ...]:
+        """Store fields as a tuple: compact and, like the section, immutable."""
+        return tuple(v)
+
+
+_SECTIONS_ADAPTER: TypeAdapter[List[DynamicSection]] = TypeAdapter(List[DynamicSection])
 
 
 class FlexibleWaterProjectData(BaseSchema):
@@ -132,15 +162,34 @@ class FlexibleWaterProjectData(BaseSchema):
     budget: Optional[float] = Field(default=None, description="Project budget in USD")
 
     # Dynamic technical data (the key part!)
-    technical_sections: List[DynamicSection] = Field(
-        default_factory=list, description="User-defined technical sections with custom fields"
+    technical_sections: Sequence[DynamicSection] = Field(
+        default=(), description="User-defined technical sections with custom fields"
     )
 
     # Additional context
     notes: Optional[str] = Field(default=None, description="General notes")
-    regulations: Optional[List[str]] = Field(default=None, description="Applicable regulations")
+    regulations: Optional[Sequence[str]] = Field(default=None, description="Applicable regulations")
     field_observations: Optional[str] = Field(default=None, description="Field observations")
 
+    # to_ai_context() result, dropped whenever a field is reassigned
+    _ai_context_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    @field_validator("technical_sections", "regulations", mode="after")
+    @classmethod
+    def freeze_sequences(cls, v: Optional[Sequence[Any]]) -> Optional[Tuple[Any, ...]]:
+        """Store as tuples so the cached AI context can't go stale in place."""
+        return None if v is None else tuple(v)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._ai_context_cache = None
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        copy = super().model_copy(update=update, deep=deep)
+        copy._ai_context_cache = None
+        return copy
+
     @classmethod
     def from_project_jsonb(cls, project) -> "FlexibleWaterProjectData":
         """
@@ -159,11 +208,8 @@ class FlexibleWaterProjectData(BaseSchema):
         data = project.project_data or {}
         sections_data = data.get("technical_sections", [])
 
-        # Convert raw dicts to DynamicSection instances
-        sections = [
-            DynamicSection(**section_dict) if isinstance(section_dict, dict) else section_dict
-            for section_dict in sections_data
-        ]
+        # Validate the whole list of raw dicts in a single pass
+        sections = _SECTIONS_ADAPTER.validate_python(sections_data)
 
         return cls(
             project_name=project.name,
@@ -197,51 +243,70 @@ class FlexibleWaterProjectData(BaseSchema):
             ## Normas Aplicables
             - **Norma**: NOM-001-SEMARNAT-2021
         """
-        output = []
+        buf = io.StringIO()
+        write = buf.write
 
         # Header
-        output.append(f"# PROYECTO: {self.project_name}")
-        output.append(f"**Cliente:** {self.client}")
-        output.append(f"**Sector:** {self.sector}")
-        output.append(f"**Ubicación:** {self.location}")
+        write(_PROJECT_HEADER)
+        write(self.project_name)
+        write(_CLIENT_PREFIX)
+        write(self.client)
+        write(_SECTOR_PREFIX)
+        write(self.sector)
+        write(_LOCATION_PREFIX)
+        write(self.location)
+        write("\n")
         if self.budget:
-            output.append(f"**Presupuesto:** ${self.budget:,.2f} USD")
-        output.append("")
+            write(f"**Presupuesto:** {_format_budget(self.budget)}\n")
+        write("\n")
 
         # Technical sections
         for section in self.technical_sections:
-            output.append(f"## {section.title}")
+            write(_SECTION_PREFIX)
+            write(section.title)
+            write("\n")
             if section.description:
-                output.append(f"_{section.description}_\n")
+                write("_")
+                write(section.description)
+                write("_\n\n")
 
             # Fields
             for field in section.fields:
                 if field.value is not None and field.value != "":
-                    formatted_value = field.format_value()
-                    output.append(f"- **{field.label}**: {formatted_value}")
+                    write(_FIELD_PREFIX)
+                    write(field.label)
+                    write(_FIELD_SEPARATOR)
+                    write(field.format_value())
+                    write("\n")
 
             # Section notes
             if section.notes:
-                output.append(f"\n_Notas de sección: {section.notes}_")
-            output.append("")
+                write("\n_Notas de sección: ")
+                write(section.notes)
+                write("_\n")
+            write("\n")
 
         # Additional context
         if self.regulations:
-            output.append("## regulations norms")
+            write("## regulations norms\n")
             for reg in self.regulations:
-                output.append(f"- {reg}")
-            output.append("")
+                write("- ")
+                write(reg)
+                write("\n")
+            write("\n")
 
         if self.field_observations:
-            output.append("## Field Observations")
-            output.append(self.field_observations)
-            output.append("")
+            write("## Field Observations\n")
+            write(self.field_observations)
+            write("\n\n")
 
         if self.notes:
-            output.append("## General Notes")
-            output.append(self.notes)
+            write("## General Notes\n")
+            write(self.notes)
+            write("\n")
 
-        return "\n".join(output)
+        # Every line was written with a trailing newline; drop the last one
+        return buf.getvalue()[:-1]
 
     def count_fields(self) -> int:
         """Count total number of fields across all sections."""
@@ -249,12 +314,23 @@ class FlexibleWaterProjectData(BaseSchema):
 
     def count_filled_fields(self) -> int:
         """Count fields with non-empty values."""
-        count = 0
+        return sum(
+            1
+            for section in self.technical_sections
+            for field in section.fields
+            if field.value is not None and field.value != ""
+        )
+
+    def count_stats(self) -> Tuple[int, int]:
+        """Return (total, filled) field counts in a single pass."""
+        total = filled = 0
         for section in self.technical_sections:
+            total += len(section.fields)
             for field in section.fields:
-                if field.value is not None and field.value != "":
-                    count += 1
-        return count
+                value = field.value
+                if value is not None and value != "":
+                    filled += 1
+        return total, filled
 
     def to_ai_context(self) -> Dict[str, Any]:
         """
@@ -272,20 +348,22 @@ class FlexibleWaterProjectData(BaseSchema):
 
         Returns:
             Clean dict with:
-            - Basic project info (name, client, sector, location)
-            - Technical sections grouped as user created them
-            - Each field as simple "label": "value unit" pair
+            - "basic": project info (name, client, sector, location, budget)
+            - "sections": technical sections by title, as the user created them,
+              each field as a simple "label": "value unit" pair
+            - "notes", "regulations", "field_observations" when provided
 
         Example:
             >>> water_data = FlexibleWaterProjectData(...)
             >>> context = water_data.to_ai_context()
             >>> print(context)
             {
-                "project_name": "Planta Sinaloa",
-                "sector": "Industrial",
-                "Water Quality": {
-                    "BOD": "450 mg/L (nota: Medido en temporada alta)",
-                    "COD": "850 mg/L"
+                "basic": {"project_name": "Planta Sinaloa", "sector": "Industrial", ...},
+                "sections": {
+                    "Water Quality": {
+                        "BOD": "450 mg/L (nota: Medido en temporada alta)",
+                        "COD": "850 mg/L"
+                    }
                 }
             }
 
@@ -293,9 +371,25 @@ class FlexibleWaterProjectData(BaseSchema):
             - This is for AI agent consumption only
             - For frontend/API use model_dump() instead
             - Reduces token count by ~85% vs full serialization
+            - Cached until a field is reassigned; each call returns its own copy
         """
+        context = self._cached_ai_context()
+        # Leaf values are str/float/tuple, so copying the dicts isolates the cache
+        copy = dict(context)
+        copy["basic"] = dict(context["basic"])
+        copy["sections"] = {title: dict(data) for title, data in context["sections"].items()}
+        return copy
+
+    def _cached_ai_context(self) -> Dict[str, Any]:
+        """Shared to_ai_context() dict; internal read-only use only."""
+        if self._ai_context_cache is None:
+            self._ai_context_cache = self._build_ai_context()
+        return self._ai_context_cache
+
+    def _build_ai_context(self) -> Dict[str, Any]:
+        """Build the to_ai_context() dict (uncached)."""
         # Basic project metadata
-        context: Dict[str, Any] = {
+        basic: Dict[str, Any] = {
             "project_name": self.project_name,
             "client": self.client,
             "sector": self.sector,
@@ -305,44 +399,42 @@ class FlexibleWaterProjectData(BaseSchema):
 
         # Add budget if specified
         if self.budget and self.budget > 0:
-            context["budget_usd"] = self.budget
+            basic["budget_usd"] = self.budget
 
         # Extract technical sections with clean field values
+        sections: Dict[str, Dict[str, str]] = {}
         for section in self.technical_sections:
             section_data = {}
 
             for field in section.fields:
-                # Skip empty/null values
-                if field.value in [None, "", []]:
+                # Skip empty/null values (None, "", [])
+                value = field.value
+                if value is None or value == "" or (isinstance(value, list) and not value):
                     continue
 
-                # Format value based on type
-                if isinstance(field.value, list):
-                    # Join array values: ["A", "B"] -> "A, B"
-                    formatted_value = ", ".join(str(v) for v in field.value)
-                elif isinstance(field.value, dict):
-                    # Rare case: nested objects -> JSON string
-                    formatted_value = str(field.value)
+                # Join array values: ["A", "B"] -> "A, B"; anything else via str()
+                base = ", ".join(map(str, value)) if isinstance(value, list) else str(value)
+                unit = field.unit
+                field_notes = field.notes
+
+                # "value unit (nota: engineer's notes)" built as one string
+                if unit and field_notes:
+                    formatted_value = f"{base} {unit} (nota: {field_notes})"
+                elif unit:
+                    formatted_value = f"{base} {unit}"
+                elif field_notes:
+                    formatted_value = f"{base} (nota: {field_notes})"
                 else:
-                    # Standard: convert to string
-                    formatted_value = str(field.value)
-
-                # Append unit if exists
-                if field.unit:
-                    formatted_value = f"{formatted_value} {field.unit}"
-
-                # Append engineer's notes if provided (critical context)
-                # Use getattr for safe access (notes may not exist in all field types)
-                field_notes = getattr(field, "notes", None)
-                if field_notes:
-                    formatted_value = f"{formatted_value} (nota: {field_notes})"
+                    formatted_value = base
 
                 # Add to section using field label as key
                 section_data[field.label] = formatted_value
 
             # Only include section if it has data
             if section_data:
-                context[section.title] = section_data
+                sections[section.title] = section_data
+
+        context: Dict[str, Any] = {"basic": basic, "sections": sections}
 
         # Optional: Add notes if they exist
         if self.notes:
@@ -356,6 +448,19 @@ class FlexibleWaterProjectData(BaseSchema):
 
         return context
 
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """
+        Serialize to_ai_context() to JSON bytes with orjson.
+
+        Args:
+            indent: Pretty-print with 2-space indentation (for logs)
+
+        Returns:
+            UTF-8 JSON bytes (non-ASCII kept as-is)
+        """
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(self._cached_ai_context(), option=option)
+
     @staticmethod
     def format_ai_context_to_string(context: Dict[str, Any]) -> str:
         """
@@ -394,38 +499,25 @@ class FlexibleWaterProjectData(BaseSchema):
         # === BASIC PROJECT INFO ===
         lines.append("PROJECT OVERVIEW:")
 
-        # Define which fields go in overview
-        basic_fields = ["project_name", "client", "sector", "location", "budget_usd"]
-
-        for field_key in basic_fields:
-            if field_key in context:
-                # Format label (project_name -> Project Name)
-                label = field_key.replace("_", " ").title()
-
+        basic = context["basic"]
+        for field_key, label in _BASIC_FIELD_LABELS:
+            if field_key in basic:
                 # Format value
-                value = context[field_key]
+                value = basic[field_key]
                 if field_key == "budget_usd":
-                    lines.append(f"Budget: ${value:,.2f} USD")
+                    lines.append(f"Budget: {_format_budget(value)}")
                 else:
                     lines.append(f"{label}: {value}")
 
         lines.append("")  # Empty line for readability
 
         # === TECHNICAL SECTIONS ===
-        # These are all keys that aren't basic info or special fields
-        exclude_keys = set(basic_fields + ["notes", "regulations", "field_observations"])
-
-        for section_title, section_data in context.items():
-            # Skip if this is a basic info field or special field
-            if section_title in exclude_keys:
-                continue
-
-            # Only process if it's a dict (actual section with fields)
-            if isinstance(section_data, dict):
-                lines.append(f"{section_title.upper()}:")
-                for field_label, field_value in section_data.items():
-                    lines.append(f"- {field_label}: {field_value}")
-                lines.append("")  # Empty line after each section
+        # Already segmented by to_ai_context(): no key filtering needed
+        for section_title, section_data in context["sections"].items():
+            lines.append(f"{section_title.upper()}:")
+            for field_label, field_value in section_data.items():
+                lines.append(f"- {field_label}: {field_value}")
+            lines.append("")  # Empty line after each section
 
         # === OPTIONAL FIELDS AT END ===
         if "regulations" in context and context["regulations"]:
@@ -3,11 +3,12 @@ Proposal model.
 Represents AI-generated technical proposals for projects.
 """
 
-from sqlalchemy import Column, Float, ForeignKey, String, Text
+from sqlalchemy import Column, Float, ForeignKey, String, Text, func, select
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 
 from app.models.base import BaseModel
+from app.models.project import Project
 
 
 class Proposal(BaseModel):
@@ -39,6 +40,10 @@ class Proposal(BaseModel):
                 "generationTimeSeconds": 28.5
             }
         }
+
+    provenCases stays inside the blob (not a per-case table): it holds the
+    few cases consulted for this one proposal, is written once, and is only
+    read whole together with the rest of ai_metadata.
     
     Attributes:
         project_id: Parent project UUID
@@ -128,3 +133,15 @@ class Proposal(BaseModel):
     
     def __repr__(self) -> str:
         return f"<Proposal {self.version} for Project {self.project_id}>"
+
+
+# Proposal count per project as a correlated subquery, so list views can
+# count without loading the proposals collection. Deferred: only selected
+# when a query undefer()s it. Defined here because it needs both tables.
+Project._proposals_count = column_property(
+    select(func.count(Proposal.id))
+    .where(Proposal.project_id == Project.id)
+    .correlate_except(Proposal)
+    .scalar_subquery(),
+    deferred=True,
+)
@@ -10,14 +10,40 @@ This module contains structured Pydantic models for AI-generated proposals:
 These models define what the AI agent MUST return after analyzing user input.
 """
 
+from functools import cached_property
 from typing import Any, Literal
 
-from pydantic import Field, computed_field, model_validator
+from pydantic import ConfigDict, Field, computed_field, model_validator
 
 from app.schemas.common import BaseSchema
 
+# (attribute, error label) checked by TechnicalData.validate_costs, in order
+_CAPEX_COST_LABELS = (
+    ("equipment_cost", "Equipment cost"),
+    ("civil_works", "Civil works cost"),
+    ("installation_piping", "Installation cost"),
+    ("engineering_supervision", "Engineering cost"),
+)
+_OPEX_COST_LABELS = (
+    ("electrical_energy", "Electrical energy cost"),
+    ("chemicals", "Chemicals cost"),
+    ("personnel", "Personnel cost"),
+    ("maintenance_spare_parts", "Maintenance cost"),
+)
+
+
+class _OutputSchema(BaseSchema):
+    """
+    Base for agent output models: immutable once validated.
+
+    Nothing modifies agent output after parsing, so frozen models skip the
+    per-assignment __setattr__ machinery and keep cached totals consistent.
+    """
 
-class EquipmentSpec(BaseSchema):
+    model_config = ConfigDict(frozen=True)
+
+
+class EquipmentSpec(_OutputSchema):
     """Individual equipment specification with technical semantic analysis"""
 
     type: str = Field(description="Equipment type (e.g., Biological Reactor, Sand Filter)")
@@ -47,7 +73,7 @@ class EquipmentSpec(BaseSchema):
     )
 
 
-class TreatmentParameter(BaseSchema):
+class TreatmentParameter(_OutputSchema):
     """Single water quality parameter treatment performance"""
 
     parameter_name: str = Field(
@@ -72,7 +98,7 @@ class TreatmentParameter(BaseSchema):
     )
 
 
-class TreatmentEfficiency(BaseSchema):
+class TreatmentEfficiency(_OutputSchema):
     """
     Treatment efficiency for ALL user-provided parameters.
 
@@ -102,7 +128,7 @@ class TreatmentEfficiency(BaseSchema):
     )
 
 
-class FinancialBreakdown(BaseSchema):
+class FinancialBreakdown(_OutputSchema):
     """Basic financial breakdown"""
 
     equipment_cost: float = Field(description="Equipment cost")
@@ -112,7 +138,7 @@ class FinancialBreakdown(BaseSchema):
     contingency: float | None = Field(default=None, description="Contingencies")
 
 
-class OperationalCosts(BaseSchema):
+class OperationalCosts(_OutputSchema):
     """Annual operational costs"""
 
     electrical_energy: float = Field(description="Annual electrical energy")
@@ -121,7 +147,7 @@ class OperationalCosts(BaseSchema):
     maintenance_spare_parts: float = Field(description="Annual maintenance and spare parts")
 
 
-class OperationalData(BaseSchema):
+class OperationalData(_OutputSchema):
     """System operational data"""
 
     required_area_m2: float = Field(description="Required area in m²")
@@ -133,7 +159,7 @@ class OperationalData(BaseSchema):
     )
 
 
-class DesignParameters(BaseSchema):
+class DesignParameters(_OutputSchema):
     """Design parameters calculated by agent"""
 
     peak_factor: float = Field(description="Peak flow factor (calculated based on project)")
@@ -145,7 +171,7 @@ class DesignParameters(BaseSchema):
     )
 
 
-class WaterParameter(BaseSchema):
+class WaterParameter(_OutputSchema):
     """Flexible water quality parameter for any sector"""
 
     parameter: str = Field(description="Parameter name (e.g., BOD, Heavy metals, pH, Chromium)")
@@ -154,7 +180,7 @@ class WaterParameter(BaseSchema):
     target_value: float | None = Field(default=None, description="Target effluent value")
 
 
-class InfluentCharacteristics(BaseSchema):
+class InfluentCharacteristics(_OutputSchema):
     """Flexible influent characteristics - water quality only (flow is in TechnicalData)"""
 
     parameters: list[WaterParameter] = Field(
@@ -162,7 +188,7 @@ class InfluentCharacteristics(BaseSchema):
     )
 
 
-class ProjectRequirements(BaseSchema):
+class ProjectRequirements(_OutputSchema):
     """Project requirements and constraints"""
 
     influent_characteristics: InfluentCharacteristics = Field(
@@ -179,7 +205,7 @@ class ProjectRequirements(BaseSchema):
     )
 
 
-class SelectedTechnology(BaseSchema):
+class SelectedTechnology(_OutputSchema):
     """Technology selected for treatment stage"""
 
     stage: str = Field(description="Treatment stage: primary/secondary/tertiary")
@@ -187,7 +213,7 @@ class SelectedTechnology(BaseSchema):
     justification: str = Field(description="Technical reasoning for selection")
 
 
-class RejectedAlternative(BaseSchema):
+class RejectedAlternative(_OutputSchema):
     """Alternative technology considered but not selected"""
 
     technology: str = Field(description="Technology name")
@@ -195,7 +221,7 @@ class RejectedAlternative(BaseSchema):
     stage: str | None = Field(default=None, description="Stage it was considered for")
 
 
-class TechnologySelection(BaseSchema):
+class TechnologySelection(_OutputSchema):
     """Technology selection with justifications"""
 
     selected_technologies: list[SelectedTechnology] = Field(
@@ -206,7 +232,7 @@ class TechnologySelection(BaseSchema):
     )
 
 
-class TechnicalData(BaseSchema):
+class TechnicalData(_OutputSchema):
     """Complete technical system data - single source of truth"""
 
     design_flow_m3_day: float = Field(gt=0, description="Design flow rate in m³/day")
@@ -227,55 +253,57 @@ class TechnicalData(BaseSchema):
     roi_percent: float | None = None
 
     @computed_field
-    @property
+    @cached_property
     def capex_usd(self) -> float:
-        """Total CAPEX computed from breakdown"""
-        return sum([
-            self.capex_breakdown.equipment_cost,
-            self.capex_breakdown.civil_works,
-            self.capex_breakdown.installation_piping,
-            self.capex_breakdown.engineering_supervision,
-            self.capex_breakdown.contingency or 0,
-        ])
+        """Total CAPEX computed from breakdown (computed once, on first access)"""
+        capex = self.capex_breakdown
+        return (
+            capex.equipment_cost
+            + capex.civil_works
+            + capex.installation_piping
+            + capex.engineering_supervision
+            + (capex.contingency or 0)
+        )
 
     @computed_field
-    @property
+    @cached_property
     def annual_opex_usd(self) -> float:
-        """Total annual OPEX computed from breakdown"""
-        return sum([
-            self.opex_breakdown.electrical_energy,
-            self.opex_breakdown.chemicals,
-            self.opex_breakdown.personnel,
-            self.opex_breakdown.maintenance_spare_parts,
-        ])
+        """Total annual OPEX computed from breakdown (computed once, on first access)"""
+        opex = self.opex_breakdown
+        return (
+            opex.electrical_energy
+            + opex.chemicals
+            + opex.personnel
+            + opex.maintenance_spare_parts
+        )
 
     @model_validator(mode="after")
     def validate_costs(self) -> "TechnicalData":
         """Validate cost breakdowns are positive"""
-        # CAPEX validation
-        if self.capex_breakdown.equipment_cost < 0:
-            raise ValueError("Equipment cost cannot be negative")
-        if self.capex_breakdown.civil_works < 0:
-            raise ValueError("Civil works cost cannot be negative")
-        if self.capex_breakdown.installation_piping < 0:
-            raise ValueError("Installation cost cannot be negative")
-        if self.capex_breakdown.engineering_supervision < 0:
-            raise ValueError("Engineering cost cannot be negative")
-
-        # OPEX validation
-        if self.opex_breakdown.electrical_energy < 0:
-            raise ValueError("Electrical energy cost cannot be negative")
-        if self.opex_breakdown.chemicals < 0:
-            raise ValueError("Chemicals cost cannot be negative")
-        if self.opex_breakdown.personnel < 0:
-            raise ValueError("Personnel cost cannot be negative")
-        if self.opex_breakdown.maintenance_spare_parts < 0:
-            raise ValueError("Maintenance cost cannot be negative")
-
+        capex = self.capex_breakdown
+        opex = self.opex_breakdown
+        # Fast path: one comparison when every cost is non-negative
+        if min(
+            capex.equipment_cost,
+            capex.civil_works,
+            capex.installation_piping,
+            capex.engineering_supervision,
+            opex.electrical_energy,
+            opex.chemicals,
+            opex.personnel,
+            opex.maintenance_spare_parts,
+        ) >= 0:
+            return self
+
+        # Slow path: report the first negative cost (CAPEX before OPEX)
+        for breakdown, costs in ((capex, _CAPEX_COST_LABELS), (opex, _OPEX_COST_LABELS)):
+            for attr, label in costs:
+                if getattr(breakdown, attr) < 0:
+                    raise ValueError(f"{label} cannot be negative")
         return self
 
 
-class ProposalOutput(BaseSchema):
+class ProposalOutput(_OutputSchema):
     """
     Complete technical proposal output from AI agent.
 
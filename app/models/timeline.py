@@ -3,8 +3,8 @@ Timeline event model.
 Represents project history and activity log.
 """
 
-from sqlalchemy import Column, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import Column, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -27,7 +27,7 @@ class TimelineEvent(BaseModel):
         title: Event title
         description: Detailed event description
         actor: User who performed the action
-        event_metadata: Additional event data (JSON)
+        event_metadata: Additional event data (JSONB)
     """
     
     __tablename__ = "timeline_events"
@@ -36,7 +36,6 @@ class TimelineEvent(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     
     event_type = Column(
@@ -57,11 +56,21 @@ class TimelineEvent(BaseModel):
     
     # Metadata (renamed to avoid SQLAlchemy reserved name conflict)
     event_metadata = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Additional event data (old_value, new_value, etc.)",
     )
     
+    # Recent events per project come straight off the index (no sort);
+    # also serves plain project_id lookups
+    __table_args__ = (
+        Index(
+            "ix_timeline_events_project_created",
+            "project_id",
+            text("created_at DESC"),
+        ),
+    )
+    
     # Relationships
     project = relationship("Project", back_populates="timeline")
     
@@ -1,36 +1,63 @@
-"""Pydantic schemas for request/response validation."""
-
-from app.schemas.common import PaginatedResponse, APIError, SuccessResponse
-from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse
-from app.schemas.project import (
-    ProjectCreate,
-    ProjectUpdate,
-    ProjectSummary,
-    ProjectDetail,
-)
-from app.schemas.proposal import (
-    ProposalGenerationRequest,
-    ProposalJobStatus,
-    ProposalResponse,
-)
-
-__all__ = [
+"""
+Pydantic schemas for request/response validation.
+
+Re-exports are resolved lazily (PEP 562): importing one schema module,
+e.g. app.schemas.common, doesn't build every other module's validators.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.schemas.common import PaginatedResponse, APIError, SuccessResponse
+    from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse
+    from app.schemas.project import (
+        ProjectCreate,
+        ProjectUpdate,
+        ProjectSummary,
+        ProjectDetail,
+    )
+    from app.schemas.proposal import (
+        ProposalGenerationRequest,
+        ProposalJobStatus,
+        ProposalResponse,
+    )
+
+# Exported name -> defining module
+_LAZY_EXPORTS = {
     # Common
-    "PaginatedResponse",
-    "APIError",
-    "SuccessResponse",
+    "PaginatedResponse": "app.schemas.common",
+    "APIError": "app.schemas.common",
+    "SuccessResponse": "app.schemas.common",
     # User
-    "UserCreate",
-    "UserLogin",
-    "UserResponse",
-    "TokenResponse",
+    "UserCreate": "app.schemas.user",
+    "UserLogin": "app.schemas.user",
+    "UserResponse": "app.schemas.user",
+    "TokenResponse": "app.schemas.user",
     # Project
-    "ProjectCreate",
-    "ProjectUpdate",
-    "ProjectSummary",
-    "ProjectDetail",
+    "ProjectCreate": "app.schemas.project",
+    "ProjectUpdate": "app.schemas.project",
+    "ProjectSummary": "app.schemas.project",
+    "ProjectDetail": "app.schemas.project",
     # Proposal
-    "ProposalGenerationRequest",
-    "ProposalJobStatus",
-    "ProposalResponse",
-]
+    "ProposalGenerationRequest": "app.schemas.proposal",
+    "ProposalJobStatus": "app.schemas.proposal",
+    "ProposalResponse": "app.schemas.proposal",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining module on first access and cache the attribute."""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
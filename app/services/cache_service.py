@@ -6,11 +6,45 @@ import json
 import logging
 from typing import Any, Optional
 import redis.asyncio as aioredis
+from redis.commands.core import AsyncScript
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Approximate sliding window (two counters per key, one round-trip).
+# KEYS[1] = hash key, ARGV[1] = window ms, ARGV[2] = limit.
+# Returns {allowed (1/0), weighted count, ms until the window rolls}.
+RATE_LIMIT_LUA = """
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local window_id = math.floor(now / window)
+
+local state = redis.call('HMGET', KEYS[1], 'win', 'prev', 'curr')
+local stored = tonumber(state[1])
+local prev = tonumber(state[2]) or 0
+local curr = tonumber(state[3]) or 0
+if stored ~= window_id then
+    if stored == window_id - 1 then prev = curr else prev = 0 end
+    curr = 0
+end
+
+local elapsed = now - window_id * window
+local weighted = prev * (1 - elapsed / window) + curr
+local allowed = 0
+if weighted < limit then
+    curr = curr + 1
+    weighted = weighted + 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'win', window_id, 'prev', prev, 'curr', curr)
+redis.call('PEXPIRE', KEYS[1], window * 2)
+return {allowed, math.ceil(weighted), window - elapsed}
+"""
+
 
 class CacheService:
     """
@@ -20,6 +54,7 @@ class CacheService:
     
     def __init__(self):
         self._redis: Optional[aioredis.Redis] = None
+        self._rate_limit_script: Optional[AsyncScript] = None
     
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -31,10 +66,14 @@ class CacheService:
             )
             # Test connection
             await self._redis.ping()
+            # EVALSHA wrapper (re-loads the script on NOSCRIPT)
+            self._rate_limit_script = self._redis.register_script(RATE_LIMIT_LUA)
+            await self._redis.script_load(RATE_LIMIT_LUA)
             logger.info("✅ Redis connected successfully")
         except Exception as e:
             logger.error(f"❌ Error connecting to Redis: {e}")
             self._redis = None
+            self._rate_limit_script = None
     
     async def close(self) -> None:
         """Close Redis connection."""
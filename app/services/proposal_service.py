@@ -25,7 +25,8 @@ from tenacity import (
     wait_exponential,
 )
 
-from app.core.database import AsyncSessionLocal
+from app.core.config import settings
+from app.core.database import get_async_sessionmaker
 
 # OpenAI exception types for retry logic
 try:
@@ -180,12 +181,13 @@ class ProposalService:
             )
             try:
                 water_data = FlexibleWaterProjectData.from_project_jsonb(project)
+                total_fields, filled_fields = water_data.count_stats()
                 logger.info(
                     "technical_data_loaded",
                     project_id=str(project.id),
-                    filled_fields=water_data.count_filled_fields(),
-                    total_fields=water_data.count_fields(),
-                    completeness_percent=round(water_data.count_filled_fields() / water_data.count_fields() * 100, 1)
+                    filled_fields=filled_fields,
+                    total_fields=total_fields,
+                    completeness_percent=round(filled_fields / total_fields * 100, 1) if total_fields > 0 else 0
                 )
                 return water_data
             except Exception as e:
@@ -253,10 +255,6 @@ class ProposalService:
             user_id=str(user_id)
         )
 
-        # Note: In production, you would trigger a background task here
-        # For now, we'll store the job info and it should be processed by a worker
-        # TODO: Implement Celery or FastAPI BackgroundTasks
-
         return job_id
 
     @staticmethod
@@ -327,16 +325,17 @@ class ProposalService:
             )
 
             # Log technical data summary
+            total_fields, filled_fields = technical_data.count_stats()
             logger.info(
                 "📦 TECHNICAL DATA SUMMARY",
                 project_id=str(project_id),
                 job_id=job_id,
                 data_source="jsonb" if project.project_data else "relational",
-                total_fields=technical_data.count_fields(),
-                filled_fields=technical_data.count_filled_fields(),
+                total_fields=total_fields,
+                filled_fields=filled_fields,
                 completeness_percent=round(
-                    technical_data.count_filled_fields() / technical_data.count_fields() * 100, 1
-                ) if technical_data.count_fields() > 0 else 0,
+                    filled_fields / total_fields * 100, 1
+                ) if total_fields > 0 else 0,
             )
 
             # ═══════════════════════════════════════════════════════════════════
@@ -348,7 +347,7 @@ class ProposalService:
             logger.info(
                 "🎯 CLEAN AI CONTEXT (no UI metadata):",
                 context_keys=list(ai_context.keys()),
-                sections_count=len([k for k, v in ai_context.items() if isinstance(v, dict)]),
+                sections_count=len(ai_context["sections"]),
                 estimated_tokens=len(ai_context_str) // 4,  # Rough estimate: 1 token ≈ 4 chars
             )
 
@@ -480,17 +479,18 @@ class ProposalService:
                 current_step="Saving proposal...",
             )
             # Get latest proposal version to determine new version
+            # (version column only: don't pull the ai_metadata blob)
             result = await db.execute(
-                select(Proposal)
+                select(Proposal.version)
                 .where(Proposal.project_id == project_id)
                 .order_by(Proposal.created_at.desc())
                 .limit(1)
             )
-            latest_proposal = result.scalar_one_or_none()
+            latest_version = result.scalar_one_or_none()
 
-            if latest_proposal:
+            if latest_version:
                 # Parse version and increment
-                version_num = float(latest_proposal.version.replace("v", ""))
+                version_num = float(latest_version.replace("v", ""))
                 new_version = f"v{version_num + 0.1:.1f}"
             else:
                 new_version = "v1.0"
@@ -593,10 +593,45 @@ class ProposalService:
                 error=str(e),
             )
 
+    @staticmethod
+    async def enqueue_proposal_generation(
+        project_id: uuid.UUID,
+        request: ProposalGenerationRequest,
+        job_id: str,
+        user_id: uuid.UUID,
+    ) -> str:
+        """
+        Queue proposal generation on the Celery worker pool.
+
+        Only serializable arguments are sent to the broker. The Celery task ID
+        is stored next to the job status so polling can detect worker crashes.
+
+        Returns:
+            Celery task ID
+        """
+        from app.services.proposal_tasks import generate_proposal_task
+
+        # .delay() publishes to the broker synchronously - keep it off the event loop
+        async_result = await asyncio.to_thread(
+            generate_proposal_task.delay,
+            project_id=str(project_id),
+            request=request.model_dump(mode="json"),
+            job_id=job_id,
+            user_id=str(user_id),
+        )
+        await cache_service.set(f"job:{job_id}:task", async_result.id, ttl=3600)
+
+        logger.info("proposal_job_enqueued", job_id=job_id, task_id=async_result.id)
+        return async_result.id
+
     @staticmethod
     async def get_job_status(job_id: str) -> dict[str, Any] | None:
         """
         Get proposal generation job status.
+
+        With the Celery backend, the task state is also checked so a worker
+        that died mid-generation is reported as failed instead of hanging
+        in "processing" until the status key expires.
         
         Args:
             job_id: Job identifier
@@ -604,7 +639,33 @@ class ProposalService:
         Returns:
             Job status data or None
         """
-        return await cache_service.get_job_status(job_id)
+        status_data = await cache_service.get_job_status(job_id)
+
+        if settings.JOB_BACKEND != "celery":
+            return status_data
+
+        task_id = await cache_service.get(f"job:{job_id}:task")
+        if not task_id:
+            return status_data
+
+        from celery.result import AsyncResult
+
+        from app.core.celery_app import celery_app
+
+        task_state = await asyncio.to_thread(
+            lambda: AsyncResult(task_id, app=celery_app).state
+        )
+
+        if task_state == "FAILURE" and (not status_data or status_data.get("status") != "failed"):
+            status_data = {
+                "job_id": job_id,
+                "status": "failed",
+                "progress": 0,
+                "current_step": "Failed",
+                "error": "Proposal worker failed unexpectedly",
+            }
+
+        return status_data
 
     @staticmethod
     async def generate_proposal_async_wrapper(
@@ -619,7 +680,7 @@ class ProposalService:
         IMPORTANT: Background tasks should NOT receive db session from endpoint
         because the endpoint's session closes when it returns.
         """
-        async with AsyncSessionLocal() as db:
+        async with get_async_sessionmaker()() as db:
             await ProposalService.generate_proposal_async(
                 db=db,
                 project_id=project_id,
@@ -0,0 +1,62 @@
+"""
+Celery tasks for proposal generation.
+
+Tasks receive only JSON-serializable arguments (UUIDs as str, request as dict)
+and run the async ProposalService workflow on the worker's own event loop.
+"""
+
+import asyncio
+from uuid import UUID
+
+import structlog
+
+from app.core.celery_app import celery_app
+from app.core.database import close_db
+from app.schemas.proposal import ProposalGenerationRequest
+from app.services.cache_service import cache_service
+
+logger = structlog.get_logger(__name__)
+
+
+async def _run_proposal_generation(
+    project_id: str,
+    request: dict,
+    job_id: str,
+    user_id: str,
+) -> None:
+    """Connect worker resources, run generation, then release them."""
+    from app.services.proposal_service import ProposalService
+
+    await cache_service.connect()
+    try:
+        await ProposalService.generate_proposal_async_wrapper(
+            project_id=UUID(project_id),
+            request=ProposalGenerationRequest.model_validate(request),
+            job_id=job_id,
+            user_id=UUID(user_id),
+        )
+    finally:
+        await cache_service.close()
+        # asyncpg connections are bound to this task's event loop
+        await close_db()
+
+
+@celery_app.task(name="proposals.generate")
+def generate_proposal_task(
+    project_id: str,
+    request: dict,
+    job_id: str,
+    user_id: str,
+) -> str:
+    """
+    Generate an AI proposal in a Celery worker.
+
+    Progress and results are reported through the job status key in Redis,
+    exactly as with the in-process background task.
+
+    Returns:
+        The job ID (for correlation in the result backend)
+    """
+    logger.info("celery_proposal_task_started", job_id=job_id, project_id=project_id)
+    asyncio.run(_run_proposal_generation(project_id, request, job_id, user_id))
+    return job_id
@@ -1,6 +1,7 @@
 import aioboto3
 import os
 import aiofiles
+import aiofiles.os
 import logging
 from io import BytesIO
 from pathlib import Path
@@ -90,6 +91,29 @@ async def get_presigned_url(filename: str, expires: int = 3600) -> str:
         logger.error(f"Error al generar URL: {str(e)}")
         return ""
 
+async def get_presigned_url_cached(filename: str, expires: int = 3600) -> str:
+    """
+    Igual que get_presigned_url, pero reutiliza la URL firmada desde Redis.
+
+    La URL se guarda por (expires - 300) segundos para que nunca se entregue
+    una URL a punto de expirar. En modo local no se cachea (no hay firma).
+    """
+    if not USE_S3:
+        return await get_presigned_url(filename, expires=expires)
+
+    from app.services.cache_service import cache_service
+
+    cache_key = f"pdf:url:{filename}"
+    cached_url = await cache_service.get(cache_key)
+    if cached_url:
+        return cached_url
+
+    url = await get_presigned_url(filename, expires=expires)
+    ttl = expires - 300
+    if url and ttl > 0:
+        await cache_service.set(cache_key, url, ttl=ttl)
+    return url
+
 async def download_file_content(filename: str) -> bytes:
     """Descarga el contenido de un archivo desde S3 o local como bytes"""
     try:
@@ -123,3 +147,25 @@ async def download_file_content(filename: str) -> bytes:
     except Exception as e:
         logger.error(f"Error descargando archivo {filename}: {str(e)}")
         raise
+
+async def delete_file_from_storage(filename: str) -> None:
+    """Elimina un archivo de S3 o del almacenamiento local (no falla si no existe)"""
+    if USE_S3:  # Modo producción: eliminar de S3
+        session = aioboto3.Session()
+
+        # Misma lógica que en upload: usar rol de IAM por defecto
+        client_args = {"region_name": S3_REGION}
+        if S3_ACCESS_KEY and S3_SECRET_KEY:
+            client_args["aws_access_key_id"] = S3_ACCESS_KEY
+            client_args["aws_secret_access_key"] = S3_SECRET_KEY
+
+        async with session.client("s3", **client_args) as s3:
+            await s3.delete_object(Bucket=S3_BUCKET, Key=filename)
+        logger.info(f"🗑️ Archivo eliminado de S3: {filename}")
+    else:  # Modo desarrollo: eliminar archivo local
+        local_path = os.path.join(LOCAL_UPLOADS_DIR, filename)
+        try:
+            await aiofiles.os.remove(local_path)
+            logger.info(f"🗑️ Archivo local eliminado: {local_path}")
+        except FileNotFoundError:
+            pass
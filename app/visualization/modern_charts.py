@@ -5,8 +5,9 @@ Premium visualization generator
 Professional approach for treatment train diagrams
 """
 
+import asyncio
 import base64
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List
 import logging
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -16,6 +17,8 @@ import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch, Rectangle, Circle, Polygon
 import numpy as np
 
+from app.core.executors import get_chart_executor
+
 logger = logging.getLogger("hydrous")
 
 # Import new simple diagrams system
@@ -2017,4 +2020,47 @@ class PremiumChartGenerator:
             return self._create_fallback_diagram(f"Error en diagrama simple: {str(e)}")
 
 # Instancia global
-premium_chart_generator = PremiumChartGenerator() 
\ No newline at end of file
+premium_chart_generator = PremiumChartGenerator()
+
+
+# Per-chart entry points (picklable, one process-pool task each)
+def render_process_flow(agent_data: Dict[str, Any]) -> str:
+    return premium_chart_generator.generate_simple_process_diagram(agent_data)
+
+
+def render_financial_executive(agent_data: Dict[str, Any]) -> str:
+    return premium_chart_generator._create_financial_chart_plotly(agent_data)
+
+
+EXECUTIVE_CHART_RENDERERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    'process_flow': render_process_flow,
+    'financial_executive': render_financial_executive,
+}
+
+
+async def generate_executive_charts_async(metadata: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Render executive charts concurrently in the chart process pool.
+
+    Same output as PremiumChartGenerator.generate_executive_charts, but each chart is an independent
+    pool task (the pool size bounds concurrency).
+    """
+    agent_data = metadata.get('data_for_charts', {})
+    if not agent_data:
+        logger.warning("⚠️ No technical data from agent")
+        return premium_chart_generator._generate_no_data_charts()
+
+    loop = asyncio.get_running_loop()
+    executor = get_chart_executor()
+    names = list(EXECUTIVE_CHART_RENDERERS)
+
+    try:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, EXECUTIVE_CHART_RENDERERS[name], agent_data)
+            for name in names
+        ))
+    except Exception as e:
+        logger.error(f"❌ Error generating premium charts: {e}", exc_info=True)
+        return {"error": premium_chart_generator._create_error_message(str(e))}
+
+    return dict(zip(names, results))
@@ -14,6 +14,8 @@ from weasyprint.text.fonts import FontConfiguration
 import base64
 from io import BytesIO
 
+from app.core.executors import get_pdf_executor
+
 # Removed efficiency_utils import - working directly with TreatmentEfficiency model
 
 logger = logging.getLogger("hydrous")
@@ -26,7 +28,6 @@ class ProfessionalPDFGenerator:
     """
 
     def __init__(self):
-        self.font_config = FontConfiguration()
         self.logo_base64 = self._get_logo_base64()
 
     async def create_pdf(
@@ -56,18 +57,13 @@ class ProfessionalPDFGenerator:
                 f"📄 Generating technical PDF for conversation {conversation_id}"
             )
 
-            # Prepare HTML and CSS
-            html_content = self._create_technical_html(
-                markdown_content, metadata, charts
-            )
-            css_content = self._get_professional_css()
-
-            # Generate PDF IN MEMORY (not on disk)
-            pdf_buffer = BytesIO()
-            html_doc = HTML(string=html_content)
-            css_doc = CSS(string=css_content)
-            html_doc.write_pdf(
-                pdf_buffer, stylesheets=[css_doc], font_config=self.font_config
+            # HTML build + WeasyPrint layout are CPU-bound: keep them off the event loop
+            pdf_buffer = await asyncio.get_running_loop().run_in_executor(
+                get_pdf_executor(),
+                self._render_pdf,
+                markdown_content,
+                metadata,
+                charts,
             )
 
             # Upload to S3 or save locally
@@ -96,6 +92,26 @@ class ProfessionalPDFGenerator:
             logger.error(f"Error generating PDF: {e}", exc_info=True)
             return None
 
+    def _render_pdf(
+        self, markdown_content: str, metadata: Dict[str, Any], charts: Dict[str, str]
+    ) -> BytesIO:
+        """Render the proposal to an in-memory PDF (blocking)."""
+        html_content = self._create_technical_html(markdown_content, metadata, charts)
+        css_content = self._get_professional_css()
+
+        # One FontConfiguration per render: it wraps a Pango/fontconfig font
+        # map that must not be shared across the PDF pool's threads
+        font_config = FontConfiguration()
+
+        # Generate PDF IN MEMORY (not on disk)
+        pdf_buffer = BytesIO()
+        html_doc = HTML(string=html_content)
+        css_doc = CSS(string=css_content, font_config=font_config)
+        html_doc.write_pdf(
+            pdf_buffer, stylesheets=[css_doc], font_config=font_config
+        )
+        return pdf_buffer
+
     def _create_technical_html(
         self, markdown_content: str, metadata: Dict[str, Any], charts: Dict[str, str]
     ) -> str:
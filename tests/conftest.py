@@ -0,0 +1,13 @@
+"""
+Shared pytest setup.
+
+Settings are validated at import time, so the required secrets get
+test-only defaults here (real environment variables still win).
+"""
+
+import os
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("POSTGRES_PASSWORD", "test-password-123")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-0123456789abcdefghijkl")
+os.environ.setdefault("OPENAI_API_KEY", "sk-test-0123456789abcdefghij")
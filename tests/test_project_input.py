@@ -0,0 +1,251 @@
+"""
+Unit Tests for FlexibleWaterProjectData
+
+Covers the cached to_ai_context() (invalidation on reassignment, isolation
+from in-place mutation), its segmented shape and prompt text, and the JSON
+views logged by the proposal agent.
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.project_input import FlexibleWaterProjectData
+
+
+# ============================================================================
+# TEST FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def water_data():
+    """Small project with one section and two regulations"""
+    return FlexibleWaterProjectData(
+        project_name="Planta Sinaloa",
+        client="Industria ABC",
+        sector="Industrial",
+        subsector="Food & Beverage",
+        location="Culiacán, Sinaloa",
+        budget=250000.0,
+        technical_sections=[
+            {
+                "id": "water-quality",
+                "title": "Water Quality",
+                "fields": [
+                    {"id": "bod", "label": "BOD", "value": 450, "unit": "mg/L", "notes": "Peak season"},
+                    {"id": "cod", "label": "COD", "value": 850, "unit": "mg/L"},
+                ],
+            }
+        ],
+        regulations=["NOM-001-SEMARNAT-2021", "NOM-002-SEMARNAT-1996"],
+    )
+
+
+@pytest.fixture
+def full_water_data():
+    """Project exercising every context key, empty values and list values"""
+    return FlexibleWaterProjectData(
+        project_name="Planta Sinaloa",
+        client="Industria ABC",
+        sector="Industrial",
+        subsector="Food & Beverage",
+        location="Culiacán, Sinaloa",
+        budget=250000.0,
+        technical_sections=[
+            {
+                "id": "water-quality",
+                "title": "Water Quality",
+                "fields": [
+                    {"id": "bod", "label": "BOD", "value": 450, "unit": "mg/L", "notes": "Peak season"},
+                    {"id": "cod", "label": "COD", "value": 850, "unit": "mg/L"},
+                    {"id": "tss", "label": "TSS", "value": ""},
+                ],
+            },
+            {
+                "id": "treatment",
+                "title": "Treatment Goals",
+                "fields": [{"id": "reuse", "label": "Reuse", "value": ["Irrigation", "Cooling"]}],
+            },
+            {"id": "empty", "title": "Empty", "fields": [{"id": "x", "label": "X", "value": None}]},
+        ],
+        notes="Expansion planned for 2026",
+        regulations=["NOM-001-SEMARNAT-2021"],
+        field_observations="Odor near the equalization tank",
+    )
+
+
+# ============================================================================
+# AI CONTEXT CACHE
+# ============================================================================
+
+
+class TestAIContextCache:
+    """Tests for to_ai_context() caching"""
+
+    def test_reassigning_regulations_clears_cache(self, water_data):
+        """A reassigned field shows up in the next context"""
+        water_data.to_ai_context()
+
+        water_data.regulations = ["NOM-003-SEMARNAT-1997"]
+
+        assert water_data.to_ai_context()["regulations"] == ("NOM-003-SEMARNAT-1997",)
+
+    def test_reassigning_sections_clears_cache(self, water_data):
+        """Replacing the sections rebuilds the context"""
+        water_data.to_ai_context()
+
+        water_data.technical_sections = [
+            {"id": "flow", "title": "Flow", "fields": [{"id": "q", "label": "Flow", "value": 12, "unit": "L/s"}]}
+        ]
+
+        assert water_data.to_ai_context()["sections"] == {"Flow": {"Flow": "12 L/s"}}
+
+    def test_sequences_are_immutable(self, water_data):
+        """Sections and regulations can't be mutated in place"""
+        assert isinstance(water_data.technical_sections, tuple)
+        assert isinstance(water_data.regulations, tuple)
+        assert isinstance(water_data.technical_sections[0].fields, tuple)
+
+        with pytest.raises(AttributeError):
+            water_data.regulations.append("NOM-003-SEMARNAT-1997")
+        with pytest.raises(AttributeError):
+            water_data.technical_sections.append(water_data.technical_sections[0])
+        with pytest.raises(ValidationError):
+            water_data.technical_sections[0].title = "Renamed"
+
+    def test_mutating_result_does_not_touch_cache(self, water_data):
+        """Callers get their own copy of the cached context"""
+        context = water_data.to_ai_context()
+        context["basic"]["project_name"] = "Changed"
+        context["sections"]["Water Quality"]["BOD"] = "0 mg/L"
+        context["sections"]["Extra"] = {}
+        context["notes"] = "added"
+
+        fresh = water_data.to_ai_context()
+
+        assert fresh["basic"]["project_name"] == "Planta Sinaloa"
+        assert fresh["sections"] == {
+            "Water Quality": {"BOD": "450 mg/L (nota: Peak season)", "COD": "850 mg/L"}
+        }
+        assert "notes" not in fresh
+
+    def test_model_copy_rebuilds_context(self, water_data):
+        """Copies with updates don't inherit the original's cache"""
+        water_data.to_ai_context()
+
+        copy = water_data.model_copy(update={"project_name": "Planta Sonora"})
+
+        assert copy.to_ai_context()["basic"]["project_name"] == "Planta Sonora"
+        assert water_data.to_ai_context()["basic"]["project_name"] == "Planta Sinaloa"
+
+
+# ============================================================================
+# SERIALIZATION
+# ============================================================================
+
+
+class TestSerialization:
+    """Tests for the JSON views logged by the proposal agent"""
+
+    def test_to_json_bytes_matches_json_dumps(self, water_data):
+        """orjson output equals the json.dumps() it replaced"""
+        context = water_data.to_ai_context()
+
+        assert water_data.to_json_bytes().decode() == json.dumps(
+            context, ensure_ascii=False, separators=(",", ":")
+        )
+        assert water_data.to_json_bytes(indent=True).decode() == json.dumps(
+            context, indent=2, ensure_ascii=False
+        )
+
+    def test_model_dump_json_is_full_model(self, water_data):
+        """model_dump_json() keeps the input shape, UI metadata included"""
+        dumped = json.loads(water_data.model_dump_json(exclude_none=True))
+
+        assert dumped["project_name"] == "Planta Sinaloa"
+        assert dumped["regulations"] == ["NOM-001-SEMARNAT-2021", "NOM-002-SEMARNAT-1996"]
+        assert dumped["technical_sections"][0]["fields"][0]["id"] == "bod"
+        assert "basic" not in dumped
+
+
+# ============================================================================
+# AI CONTEXT SHAPE AND PROMPT TEXT
+# ============================================================================
+
+
+class TestAIContextFormat:
+    """Pins the segmented to_ai_context() shape and the prompt text built from it"""
+
+    def test_context_shape(self, full_water_data):
+        """Project info under "basic", non-empty sections under "sections" """
+        assert full_water_data.to_ai_context() == {
+            "basic": {
+                "project_name": "Planta Sinaloa",
+                "client": "Industria ABC",
+                "sector": "Industrial",
+                "subsector": "Food & Beverage",
+                "location": "Culiacán, Sinaloa",
+                "budget_usd": 250000.0,
+            },
+            "sections": {
+                "Water Quality": {"BOD": "450 mg/L (nota: Peak season)", "COD": "850 mg/L"},
+                "Treatment Goals": {"Reuse": "Irrigation, Cooling"},
+            },
+            "notes": "Expansion planned for 2026",
+            "regulations": ("NOM-001-SEMARNAT-2021",),
+            "field_observations": "Odor near the equalization tank",
+        }
+
+    def test_minimal_context_shape(self):
+        """Optional keys and a zero budget are left out"""
+        water_data = FlexibleWaterProjectData(
+            project_name="Planta Sonora",
+            client="Minera XYZ",
+            sector="Mining",
+            location="Hermosillo, Sonora",
+            budget=0,
+        )
+
+        context = water_data.to_ai_context()
+
+        assert list(context) == ["basic", "sections"]
+        assert "budget_usd" not in context["basic"]
+        assert context["sections"] == {}
+        assert FlexibleWaterProjectData.format_ai_context_to_string(context) == (
+            "PROJECT OVERVIEW:\n"
+            "Project Name: Planta Sonora\n"
+            "Client: Minera XYZ\n"
+            "Sector: Mining\n"
+            "Location: Hermosillo, Sonora\n"
+        )
+
+    def test_prompt_text_matches_baseline(self, full_water_data):
+        """Formatted prompt is byte-identical to the flat-dict formatter's"""
+        context = full_water_data.to_ai_context()
+
+        assert FlexibleWaterProjectData.format_ai_context_to_string(context) == (
+            "PROJECT OVERVIEW:\n"
+            "Project Name: Planta Sinaloa\n"
+            "Client: Industria ABC\n"
+            "Sector: Industrial\n"
+            "Location: Culiacán, Sinaloa\n"
+            "Budget: $250,000.00 USD\n"
+            "\n"
+            "WATER QUALITY:\n"
+            "- BOD: 450 mg/L (nota: Peak season)\n"
+            "- COD: 850 mg/L\n"
+            "\n"
+            "TREATMENT GOALS:\n"
+            "- Reuse: Irrigation, Cooling\n"
+            "\n"
+            "APPLICABLE REGULATIONS:\n"
+            "- NOM-001-SEMARNAT-2021\n"
+            "\n"
+            "FIELD OBSERVATIONS:\n"
+            "Odor near the equalization tank\n"
+            "\n"
+            "NOTES:\n"
+            "Expansion planned for 2026"
+        )
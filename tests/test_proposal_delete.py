@@ -0,0 +1,122 @@
+"""
+Unit Tests for the delete proposal endpoint
+
+The PDF must only be removed from storage once the row deletion has
+been committed; a failed commit leaves both the row and its PDF intact.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import BackgroundTasks
+
+from app.api.v1 import proposals
+
+
+# ============================================================================
+# TEST FIXTURES
+# ============================================================================
+
+
+class FakeSession:
+    """Records session calls; commit optionally fails"""
+
+    def __init__(self, commit_error=None):
+        self.calls = []
+        self.commit_error = commit_error
+
+    async def delete(self, instance):
+        self.calls.append("delete")
+
+    async def commit(self):
+        self.calls.append("commit")
+        if self.commit_error:
+            raise self.commit_error
+
+
+@pytest.fixture
+def proposal(monkeypatch):
+    """Proposal with a stored PDF, returned by the access-checked loader"""
+    proposal = SimpleNamespace(id=uuid4(), pdf_path="proposals/test.pdf")
+
+    async def load_bundle(db, project_id, proposal_id, user_id):
+        return proposal
+
+    monkeypatch.setattr(proposals, "_load_proposal_bundle", load_bundle)
+    return proposal
+
+
+@pytest.fixture
+def deleted_files(monkeypatch):
+    """Paths removed from storage"""
+    deleted = []
+
+    async def delete_file(path):
+        deleted.append(path)
+
+    async def delete_cached(key):
+        return True
+
+    monkeypatch.setattr(proposals, "delete_file_from_storage", delete_file)
+    monkeypatch.setattr(proposals.cache_service, "delete", delete_cached)
+    return deleted
+
+
+async def _delete(db, background_tasks):
+    # Bypass the rate limiter decorator
+    return await proposals.delete_proposal.__wrapped__(
+        request=None,
+        project_id=uuid4(),
+        proposal_id=uuid4(),
+        current_user=SimpleNamespace(id=uuid4()),
+        background_tasks=background_tasks,
+        db=db,
+    )
+
+
+# ============================================================================
+# DELETE PROPOSAL
+# ============================================================================
+
+
+class TestDeleteProposal:
+    """Tests for delete_proposal ordering"""
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_keeps_pdf(self, proposal, deleted_files):
+        """A commit failure propagates as-is and never touches storage"""
+        db = FakeSession(commit_error=RuntimeError("connection dropped"))
+        background_tasks = BackgroundTasks()
+
+        with pytest.raises(RuntimeError, match="connection dropped"):
+            await _delete(db, background_tasks)
+
+        assert background_tasks.tasks == []
+        assert deleted_files == []
+
+    @pytest.mark.asyncio
+    async def test_pdf_removed_after_commit(self, proposal, deleted_files):
+        """On success the PDF cleanup is queued to run after the response"""
+        db = FakeSession()
+        background_tasks = BackgroundTasks()
+
+        response = await _delete(db, background_tasks)
+
+        assert response.status_code == 204
+        assert db.calls == ["delete", "commit"]
+        assert deleted_files == []
+
+        await background_tasks()
+
+        assert deleted_files == ["proposals/test.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_no_pdf_no_cleanup(self, proposal, deleted_files):
+        """Proposals without a PDF queue nothing"""
+        proposal.pdf_path = None
+        background_tasks = BackgroundTasks()
+
+        await _delete(FakeSession(), background_tasks)
+
+        assert background_tasks.tasks == []
@@ -0,0 +1,298 @@
+"""
+Unit Tests for the auth endpoint rate limiter
+
+Covers the Redis sliding-window script (run on fakeredis' Lua engine),
+the per-process deny cache and client IP resolution behind a proxy.
+"""
+
+import pytest
+import fakeredis
+
+from app.core import rate_limit
+from app.services.cache_service import RATE_LIMIT_LUA
+
+
+LOGIN_PATH = next(path for path in rate_limit.PARSED_AUTH_LIMITS if path.endswith("/auth/jwt/login"))
+LOGIN_LIMIT, LOGIN_WINDOW_MS, LOGIN_KEY_PREFIX = rate_limit.PARSED_AUTH_LIMITS[LOGIN_PATH]
+
+
+# ============================================================================
+# TEST FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def redis():
+    """In-memory Redis with Lua scripting"""
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def script(redis):
+    """Sliding-window script registered on the fake Redis"""
+    return redis.register_script(RATE_LIMIT_LUA)
+
+
+class CountingScript:
+    """Wraps the script to count Redis round-trips"""
+
+    def __init__(self, script):
+        self.script = script
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        return await self.script(keys=keys, args=args)
+
+
+@pytest.fixture
+def bound_script(script, monkeypatch):
+    """Bind a counting script to the middleware with an empty deny cache"""
+    counting = CountingScript(script)
+    monkeypatch.setattr(rate_limit, "_DENY_UNTIL", {})
+    rate_limit.set_rate_limit_script(counting)
+    yield counting
+    rate_limit.set_rate_limit_script(None)
+
+
+async def _window_id(redis, window_ms: int) -> int:
+    """Current window number according to the (fake) Redis clock"""
+    seconds, micros = await redis.time()
+    return (seconds * 1000 + micros // 1000) // window_ms
+
+
+def _scope(headers=(), client=("10.0.0.1", 5000), path=LOGIN_PATH, method="POST"):
+    """Minimal ASGI HTTP scope"""
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(name.encode(), value.encode()) for name, value in headers],
+        "client": client,
+    }
+
+
+# ============================================================================
+# SLIDING WINDOW SCRIPT
+# ============================================================================
+
+
+class TestSlidingWindowScript:
+    """Tests for RATE_LIMIT_LUA"""
+
+    @pytest.mark.asyncio
+    async def test_allows_up_to_limit_then_blocks(self, script):
+        """Exactly `limit` requests pass in a fresh window"""
+        results = [await script(keys=["rl:test"], args=[60_000, 5]) for _ in range(7)]
+
+        assert [allowed for allowed, _, _ in results] == [1, 1, 1, 1, 1, 0, 0]
+        assert [count for _, count, _ in results[:5]] == [1, 2, 3, 4, 5]
+        # Denied requests are not counted
+        assert results[5][1] == results[6][1] == 5
+
+    @pytest.mark.asyncio
+    async def test_retry_after_within_window(self, script):
+        """Retry hint is the time left in the current window"""
+        for _ in range(3):
+            allowed, _, retry_ms = await script(keys=["rl:test"], args=[60_000, 2])
+
+        assert allowed == 0
+        assert 0 < retry_ms <= 60_000
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self, script):
+        """One client's count doesn't affect another's"""
+        for _ in range(2):
+            await script(keys=["rl:a"], args=[60_000, 2])
+
+        assert (await script(keys=["rl:a"], args=[60_000, 2]))[0] == 0
+        assert (await script(keys=["rl:b"], args=[60_000, 2]))[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_previous_window_is_weighted(self, redis, script):
+        """A saturated previous window still counts against the current one"""
+        window = 3_600_000
+        current = await _window_id(redis, window)
+        await redis.hset("rl:test", mapping={"win": current - 1, "prev": 0, "curr": 1_000_000})
+
+        allowed, count, _ = await script(keys=["rl:test"], args=[window, 5])
+
+        assert allowed == 0
+        assert count > 5
+        state = await redis.hgetall("rl:test")
+        assert state == {"win": str(current), "prev": "1000000", "curr": "0"}
+
+    @pytest.mark.asyncio
+    async def test_stale_windows_expire(self, redis, script):
+        """Counts older than the previous window are dropped"""
+        window = 60_000
+        current = await _window_id(redis, window)
+        await redis.hset("rl:test", mapping={"win": current - 2, "prev": 100, "curr": 100})
+
+        allowed, count, _ = await script(keys=["rl:test"], args=[window, 5])
+
+        assert (allowed, count) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_key_ttl_covers_two_windows(self, redis, script):
+        """State expires in Redis once it can no longer be weighted"""
+        await script(keys=["rl:test"], args=[60_000, 5])
+
+        assert 0 < await redis.pttl("rl:test") <= 120_000
+
+
+# ============================================================================
+# AUTH RATE LIMIT CHECK
+# ============================================================================
+
+
+class TestCheckAuthRateLimit:
+    """Tests for _check_auth_rate_limit and the deny cache"""
+
+    @pytest.mark.asyncio
+    async def test_blocks_after_limit(self, bound_script):
+        """The request after the endpoint limit gets a Retry-After"""
+        for _ in range(LOGIN_LIMIT):
+            assert await rate_limit._check_auth_rate_limit(LOGIN_PATH, "1.2.3.4") is None
+
+        retry_after = await rate_limit._check_auth_rate_limit(LOGIN_PATH, "1.2.3.4")
+
+        assert 0 < retry_after <= LOGIN_WINDOW_MS / 1000
+        assert (LOGIN_PATH, "1.2.3.4") in rate_limit._DENY_UNTIL
+        # Other clients are unaffected
+        assert await rate_limit._check_auth_rate_limit(LOGIN_PATH, "5.6.7.8") is None
+
+    @pytest.mark.asyncio
+    async def test_denied_client_skips_redis(self, bound_script):
+        """Repeat offenders are rejected from the deny cache"""
+        for _ in range(LOGIN_LIMIT + 1):
+            await rate_limit._check_auth_rate_limit(LOGIN_PATH, "1.2.3.4")
+        calls = bound_script.calls
+
+        assert await rate_limit._check_auth_rate_limit(LOGIN_PATH, "1.2.3.4") is not None
+        assert bound_script.calls == calls
+
+    @pytest.mark.asyncio
+    async def test_deny_entry_expires(self, bound_script, redis, monkeypatch):
+        """Once the deadline passes, Redis is consulted again"""
+        for _ in range(LOGIN_LIMIT + 1):
+            await rate_limit._check_auth_rate_limit(LOGIN_PATH, "1.2.3.4")
+        deadline = rate_limit._DENY_UNTIL[(LOGIN_PATH, "1.2.3.4")]
+        await redis.delete(LOGIN_KEY_PREFIX + "1.2.3.4")  # Redis window rolled over too
+        monkeypatch.setattr(rate_limit.time, "monotonic", lambda: deadline + 1)
+        calls = bound_script.calls
+
+        assert await rate_limit._check_auth_rate_limit(LOGIN_PATH, "1.2.3.4") is None
+        assert bound_script.calls == calls + 1
+        assert (LOGIN_PATH, "1.2.3.4") not in rate_limit._DENY_UNTIL
+
+    @pytest.mark.asyncio
+    async def test_deny_cache_evicts_oldest(self, bound_script, monkeypatch):
+        """The deny cache is bounded; the oldest client is evicted first"""
+        monkeypatch.setattr(rate_limit, "_DENY_CACHE_MAX", 2)
+        for ip in ("1.1.1.1", "2.2.2.2", "3.3.3.3"):
+            for _ in range(LOGIN_LIMIT + 1):
+                await rate_limit._check_auth_rate_limit(LOGIN_PATH, ip)
+
+        assert list(rate_limit._DENY_UNTIL) == [(LOGIN_PATH, "2.2.2.2"), (LOGIN_PATH, "3.3.3.3")]
+
+    @pytest.mark.asyncio
+    async def test_fails_open_without_redis(self, monkeypatch):
+        """Requests pass when Redis is unavailable"""
+        monkeypatch.setattr(rate_limit, "_DENY_UNTIL", {})
+        rate_limit.set_rate_limit_script(None)
+
+        for _ in range(LOGIN_LIMIT + 3):
+            assert await rate_limit._check_auth_rate_limit(LOGIN_PATH, "1.2.3.4") is None
+
+
+# ============================================================================
+# CLIENT IP
+# ============================================================================
+
+
+class TestClientIp:
+    """Tests for _client_ip (X-Forwarded-For handling)"""
+
+    def test_untrusted_ignores_forwarded_for(self, monkeypatch):
+        """Without a trusted proxy a spoofed header can't pick the IP"""
+        monkeypatch.setattr(rate_limit, "_TRUSTED_PROXY", False)
+        scope = _scope(headers=[("x-forwarded-for", "6.6.6.6")])
+
+        assert rate_limit._client_ip(scope) == "10.0.0.1"
+
+    def test_trusted_uses_last_entry(self, monkeypatch):
+        """Behind the proxy, the address it appended is used"""
+        monkeypatch.setattr(rate_limit, "_TRUSTED_PROXY", True)
+        scope = _scope(headers=[("x-forwarded-for", "203.0.113.7")])
+
+        assert rate_limit._client_ip(scope) == "203.0.113.7"
+
+    def test_trusted_ignores_spoofed_prefix(self, monkeypatch):
+        """Client-supplied entries before the proxy's are ignored"""
+        monkeypatch.setattr(rate_limit, "_TRUSTED_PROXY", True)
+        scope = _scope(headers=[("x-forwarded-for", "6.6.6.6, 7.7.7.7,203.0.113.7")])
+
+        assert rate_limit._client_ip(scope) == "203.0.113.7"
+
+    def test_trusted_without_header_uses_peer(self, monkeypatch):
+        """Direct connections fall back to the socket peer"""
+        monkeypatch.setattr(rate_limit, "_TRUSTED_PROXY", True)
+
+        assert rate_limit._client_ip(_scope()) == "10.0.0.1"
+
+    def test_missing_client(self, monkeypatch):
+        """Scopes without a peer address map to localhost"""
+        monkeypatch.setattr(rate_limit, "_TRUSTED_PROXY", False)
+
+        assert rate_limit._client_ip(_scope(client=None)) == "127.0.0.1"
+
+
+# ============================================================================
+# MIDDLEWARE
+# ============================================================================
+
+
+class TestRateLimitMiddleware:
+    """End-to-end ASGI behaviour"""
+
+    @staticmethod
+    async def _call(middleware, scope):
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(scope, receive, send)
+        return messages[0]
+
+    @staticmethod
+    async def _app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    @pytest.mark.asyncio
+    async def test_returns_429_with_retry_after(self, bound_script, monkeypatch):
+        """Over-limit auth requests get 429 + Retry-After"""
+        monkeypatch.setattr(rate_limit, "_TRUSTED_PROXY", False)
+        middleware = rate_limit.RateLimitMiddleware(self._app)
+
+        statuses = [(await self._call(middleware, _scope()))["status"] for _ in range(LOGIN_LIMIT)]
+        denied = await self._call(middleware, _scope())
+
+        assert statuses == [200] * LOGIN_LIMIT
+        assert denied["status"] == 429
+        assert int(dict(denied["headers"])[b"retry-after"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_other_paths_pass_through(self, bound_script):
+        """Non-auth paths are never counted"""
+        middleware = rate_limit.RateLimitMiddleware(self._app)
+
+        for _ in range(LOGIN_LIMIT + 2):
+            start = await self._call(middleware, _scope(path="/api/v1/projects"))
+            assert start["status"] == 200
+        assert bound_script.calls == 0